@@ -1,7 +1,10 @@
 """Demonstrate string-based type hints and PEP 604 unions.
 
 This demo shows that strings like "A" or "int | str" provided in the
-decorator are normalized before matching.
+decorator are normalized before matching. They are evaluated once, when
+the overload is decorated, in the module that declares it. Passing the
+objects themselves (`x=A`, `x=int | str`) is equivalent and skips even
+that step; `show_direct` below uses that form.
 """
 
 from __future__ import annotations
@@ -17,7 +20,7 @@ def show(x: object) -> str:
 class A:
     """Simple class A used for string-based type annotation demo."""
 
-    pass
+    __slots__ = ()
 
 
 @dispatch.show(x="A")
@@ -32,8 +35,28 @@ def _(x: object) -> str:
     return "string-union"
 
 
+def show_direct(x: object) -> str:
+    """Fallback overload for the direct-type variant."""
+    return "fallback"
+
+
+@dispatch.show_direct(x=A)
+def _(x: A) -> str:
+    """Selected when x is instance of class A (no string to resolve)."""
+    return "direct:A"
+
+
+@dispatch.show_direct(x=int | str)
+def _(x: object) -> str:
+    """Selected when x is int or str via a PEP 604 union object."""
+    return "direct-union"
+
+
 if __name__ == "__main__":
     print(show(A()))
     print(show(5))
     print(show("x"))
     print(show(3.14))
+    print(show_direct(A()))
+    print(show_direct(5))
+    print(show_direct(3.14))
@@ -10,6 +10,8 @@ from wizedispatcher import dispatch
 class Toy:
     """Toy class used to showcase various dispatch contexts."""
 
+    __slots__ = ("_v", )
+
     def __init__(self) -> None:
         self._v = 0
 
@@ -24,14 +26,19 @@ class Toy:
         """
         return f"base:{x}"
 
+    # Passing the class itself (not the string "str") means nothing is left
+    # to evaluate when the decorator runs.
     @dispatch.m(x=str)
     def _(self, x: object) -> str:
         """Overload for `m` when x is a string (decorator enforced)."""
         return f"str:{x}"
 
+    # Keep overloads disjoint: `int` stays on the base, so an `int | float`
+    # overload would overlap it and every int call would have to be
+    # ranked between the two instead of resolving to a single match.
     @dispatch.m
-    def _(self, x: int | float) -> str:
-        """Overload for `m` when x is int or float via annotation."""
+    def _(self, x: float) -> str:
+        """Overload for `m` when x is a float via annotation."""
         return f"num:{x}"
 
     @classmethod
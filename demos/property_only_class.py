@@ -6,10 +6,15 @@ from wizedispatcher import dispatch
 
 
 class Q:
+    __slots__ = ("_v", )
+
     @property
     def v(self) -> Any:
         """Return stored value or None if not set."""
-        return getattr(self, "_v", None)
+        try:
+            return self._v
+        except AttributeError:
+            return None
 
     @v.setter
     def v(self, value: Any) -> None:
@@ -24,12 +24,21 @@ def demo(x: object) -> str:
     return "fallback"
 
 
+# A TypedDict is a plain dict at runtime, so matching runs from cheap to
+# expensive: `isinstance(x, dict)` (an exact-type pointer compare for real
+# dicts), then one set comparison for the required keys, and only then a
+# type check per value. Because the outcome depends on the dict's keys,
+# not just its type, the dispatcher never caches selections for `demo`:
+# every call is matched again, so `{"other": 1}` still falls back.
 @dispatch.demo(x=User)
 def _(x: User) -> str:
     """Handle objects matching the User TypedDict shape."""
     return f"user:{x['id']}:{x['name']}"
 
 
+# Runtime-checkable Protocol checks are among the slowest isinstance
+# calls, and they inspect each instance's members rather than its class,
+# so like the User overload they are re-run on every call to `demo`.
 @dispatch.demo(x=Greeter)
 def _(x: Callable[[str], str]) -> str:
     """Call Greeter callbacks with a fixed argument."""
@@ -38,10 +47,15 @@ def _(x: Callable[[str], str]) -> str:
 
 if __name__ == "__main__":
     print(demo({"id": 1, "name": "Ana"}))
+    # Same type, different keys: matched again rather than reusing User.
+    print(demo({"other": 1}))
 
     class G:
+        __slots__ = ()
+
         def __call__(self, name: str) -> str:
             return f"hi {name}"
 
-    print(demo(G()))
+    greeter: G = G()
+    print(demo(greeter))
     print(demo(123))
@@ -25,9 +25,11 @@ from collections.abc import Mapping as ABCMapping
 from collections.abc import MutableMapping, MutableSequence, Sequence
 from contextlib import suppress
 from dataclasses import dataclass
-from functools import update_wrapper
+from functools import lru_cache, partial, update_wrapper
 from inspect import BoundArguments, Parameter, Signature, signature
+from keyword import iskeyword
 from sys import modules
+from threading import local
 from types import MappingProxyType, ModuleType
 from typing import (
     Annotated,
@@ -53,12 +55,13 @@ from typing import (
     get_origin,
     get_type_hints,
 )
+from weakref import WeakKeyDictionary
 
 try:
-    from .typingnormalize import TypingNormalize
+    from .typingnormalize import normalize
 except Exception:  # pragma: no cover
     # Permit running this file as a script (no package context)
-    from typingnormalize import TypingNormalize  # type: ignore[reportMissingImports]
+    from typingnormalize import normalize  # type: ignore[reportMissingImports]
 
 UnionType: Optional[Any] = None
 with suppress(Exception):
@@ -66,6 +69,33 @@ with suppress(Exception):
 
 # Sentinel for "no type constraint".
 WILDCARD: Final[object] = object()
+# Shared read-only stand-in for an absent annotation mapping.
+_EMPTY: Final[Mapping[str, Any]] = MappingProxyType({})
+# Private miss marker for single-probe `dict.get` lookups.
+_MISSING: Final[object] = object()
+# Signatures of registered callables, keyed by the function object (not
+# its code: closures sharing code can differ in defaults/annotations).
+_SIGNATURES: Final[WeakKeyDictionary[Any, Signature]] = WeakKeyDictionary()
+
+
+def _signature(func: Callable[..., Any]) -> Signature:
+    """Return `inspect.signature(func)`, computed once per function.
+
+    Args:
+        func: Registered overload, adapter, or original callable.
+
+    Returns:
+        The callable's signature.
+    """
+    try:
+        return _SIGNATURES[func]
+    except KeyError:
+        sig: Signature = signature(func)
+        _SIGNATURES[func] = sig
+        return sig
+    except TypeError:
+        # Not weak-referenceable (e.g., some builtins): compute directly.
+        return signature(func)
 
 
 class TypeMatch:
@@ -90,13 +120,13 @@ class TypeMatch:
         with suppress(Exception):
             module_dict: Dict[str, Any] = vars(modules[__name__])
             if isinstance(hint, str):
-                return TypingNormalize(eval(hint, module_dict, module_dict))
+                return normalize(eval(hint, module_dict, module_dict))
             if isinstance(hint, ForwardRef):
-                return TypingNormalize(
+                return normalize(
                     eval(hint.__forward_arg__, module_dict, module_dict))
         # Fall back to returning a normalized form when possible
         with suppress(Exception):
-            return TypingNormalize(hint)
+            return normalize(hint)
         return hint
 
     @staticmethod
@@ -157,6 +187,56 @@ class TypeMatch:
                 return args[1]
         return Any
 
+    @classmethod
+    def _depends_on_value(cls, hint: object) -> bool:
+        """Return True if matching `hint` can look past `type(value)`.
+
+        TypedDicts, Protocols, Literals and parameterized generics inspect
+        the value itself (keys, items, members), so two values of the same
+        type may match differently. Dispatch only caches selections by argument
+        types when no registered hint is of this kind.
+
+        Args:
+            hint: Typing hint to classify.
+
+        Returns:
+            True when a match against `hint` depends on the value's
+            contents; False when the runtime type alone decides it.
+        """
+        try:
+            hint, origin, args = _hint_parts(hint)
+        except TypeError:
+            return True
+        if hint in (Any, object) or hint is WILDCARD:
+            return False
+        supertype: Optional[object] = getattr(hint, "__supertype__", None)
+        if callable(hint) and supertype is not None:
+            return cls._depends_on_value(supertype)
+        if (isinstance(hint, type) and issubclass(hint, dict)
+                and hasattr(hint, "__annotations__")
+                and hasattr(hint, "__total__")):
+            return True
+        # Runtime-checkable Protocols check members on each instance.
+        if isinstance(hint, type) and getattr(hint, "_is_protocol", False):
+            return True
+        if isinstance(hint, TypeVar):
+            return any(
+                cls._depends_on_value(t) for t in (*hint.__constraints__,
+                                                   hint.__bound__)
+                if t is not None)
+        if origin is Annotated:
+            return cls._depends_on_value(args[0])
+        if origin is ClassVar or cls._is_union_origin(origin):
+            return any(cls._depends_on_value(t) for t in args)
+        if origin is None or origin is Literal:
+            return origin is Literal
+        # Bare containers normalize to `List[Any]`, `Tuple[Any, ...]`,
+        # etc.; only real item types (or a fixed tuple length) inspect
+        # the contents.
+        if origin is tuple and not (len(args) == 2 and args[1] is Ellipsis):
+            return True
+        return any(a is not Any and a is not Ellipsis for a in args)
+
     @classmethod
     def _is_match(cls, value: object, hint: object) -> bool:
         """Return True if `value` conforms to typing `hint`.
@@ -172,7 +252,14 @@ class TypeMatch:
         Returns:
             True if value matches the hint, False otherwise.
         """
-        hint = cls._resolve_hint(hint)
+        origin: Optional[type]
+        args: Tuple[Any, ...]
+        try:
+            hint, origin, args = _hint_parts(hint)
+        except TypeError:
+            # Unhashable hint (e.g., a Callable parameter list).
+            hint = cls._resolve_hint(hint)
+            origin, args = get_origin(hint), get_args(hint)
         if hint in (Any, object) or hint is WILDCARD:
             return True
         supertype: Optional[object] = getattr(hint, "__supertype__", None)
@@ -183,9 +270,15 @@ class TypeMatch:
                 and hasattr(hint, "__total__")):
             if not isinstance(value, dict):
                 return False
+            required: FrozenSet[str] = getattr(hint, "__required_keys__",
+                                               frozenset())
+            # One C-level set comparison rejects missing keys before any
+            # per-value matching is attempted.
+            if not value.keys() >= required:
+                return False
             ann: Dict[str, object] = hint.__annotations__
-            for k in getattr(hint, "__required_keys__", set()):
-                if k not in value or not cls._is_match(value[k], ann[k]):
+            for k in required:
+                if not cls._is_match(value[k], ann[k]):
                     return False
             return all(not (k in value and not cls._is_match(value[k], ann[k]))
                        for k in getattr(hint, "__optional_keys__", set()))
@@ -200,8 +293,6 @@ class TypeMatch:
                 if hint.__bound__ is not None:
                     return cls._is_match(value, hint.__bound__)
             return True
-        origin: Optional[type] = get_origin(hint)
-        args: Tuple[Any, ...] = get_args(hint)
         if origin is Annotated:
             return cls._is_match(value, args[0])
         if origin is ClassVar:
@@ -450,7 +541,7 @@ class TypeMatch:
 
         for func in options:
             params: MappingProxyType[str,
-                                     Parameter] = signature(func).parameters
+                                     Parameter] = _signature(func).parameters
             varkw: Optional[Parameter] = next(
                 (p
                  for p in params.values() if p.kind == Parameter.VAR_KEYWORD),
@@ -486,6 +577,21 @@ class TypeMatch:
                  if s == max(s for _, s in ranked)] if ranked else [])
 
 
+@lru_cache(maxsize=4096, typed=True)
+def _hint_parts(
+        hint: object) -> Tuple[object, Optional[type], Tuple[Any, ...]]:
+    """Resolve `hint` once and split it into `(hint, origin, args)`.
+
+    Args:
+        hint: Hashable raw hint as given to `TypeMatch._is_match`.
+
+    Returns:
+        The resolved hint with its `get_origin` and `get_args`.
+    """
+    resolved: object = TypeMatch._resolve_hint(hint)
+    return resolved, get_origin(resolved), get_args(resolved)
+
+
 class WizeDispatcher:
     """Create namespaced decorators to register method/function overloads.
 
@@ -494,9 +600,13 @@ class WizeDispatcher:
     existing callable and keeps the original as fallback.
     """
 
-    _pending: ClassVar[Dict[str, "WizeDispatcher._OverloadDescriptor"]] = {}
+    # Per-thread owner qualname -> descriptor collecting class-body overloads.
+    _pending_tls: ClassVar[local] = local()
+    # Exact descriptor types unwrapped to their `__func__` by `_extract_func`.
+    _METHOD_WRAPPERS: ClassVar[FrozenSet[type]] = frozenset(
+        {classmethod, staticmethod})
 
-    @dataclass(frozen=True)
+    @dataclass(frozen=True, slots=True)
     class _Overload:
         """Container for an overload and its dispatch metadata.
 
@@ -526,14 +636,33 @@ class WizeDispatcher:
         configuration about skipping the first parameter.
         """
 
+        __slots__ = (
+            "_target_name",
+            "_original",
+            "_sig",
+            "_param_order",
+            "_varpos_name",
+            "_varkw_name",
+            "_binder",
+            "_overloads",
+            "_cache",
+            "_reg_counter",
+            "_skip_first",
+            "_cacheable",
+        )
+
         _target_name: str
         _original: Callable[..., Any]
         _sig: Signature
         _param_order: Tuple[str, ...]
+        _varpos_name: Optional[str]
+        _varkw_name: Optional[str]
+        _binder: Callable[..., Dict[str, Any]]
         _overloads: list["WizeDispatcher._Overload"]
         _cache: Dict[Tuple[Type[Any], ...], Callable[..., Any]]
         _reg_counter: int
         _skip_first: bool
+        _cacheable: bool
 
         def __init__(
             self,
@@ -551,13 +680,18 @@ class WizeDispatcher:
             """
             self._target_name = target_name
             self._original = original
-            self._sig = signature(obj=original)
+            self._sig = _signature(original)
             self._skip_first = skip_first
             self._param_order = WizeDispatcher._param_order(
                 sig=self._sig, skip_first=skip_first)
+            self._varpos_name, self._varkw_name = (
+                WizeDispatcher._variadic_names(sig=self._sig))
+            self._binder = WizeDispatcher._make_binder(sig=self._sig,
+                                                       name=target_name)
             self._overloads = []
             self._cache = {}
             self._reg_counter = 0
+            self._cacheable = True
 
         def _bind(
             self,
@@ -577,12 +711,11 @@ class WizeDispatcher:
                 `BoundArguments` with defaults applied and
                 `provided_keys` are names present in the call.
             """
-            raw: BoundArguments = (self._sig.bind(instance, *args, **kwargs)
-                                   if self._skip_first else self._sig.bind(
-                                       *args, **kwargs))
-            raw.apply_defaults()
-            return raw, frozenset(n for n in self._param_order
-                                  if n in raw.arguments)
+            arguments: Dict[str, Any] = (self._binder(
+                instance, *args, **kwargs) if self._skip_first else
+                                         self._binder(*args, **kwargs))
+            return BoundArguments(self._sig, arguments), frozenset(
+                n for n in self._param_order if n in arguments)
 
         def _arg_types(self, bound: BoundArguments) -> Tuple[Type[Any], ...]:
             """Return runtime types in dispatch order.
@@ -596,6 +729,44 @@ class WizeDispatcher:
             return tuple(
                 type(bound.arguments[name]) for name in self._param_order)
 
+        @staticmethod
+        def _call_with_globals(
+            func: Callable[..., Any],
+            args: List[Any],
+            kwargs: Dict[str, Any],
+            inject: Dict[str, Any],
+        ) -> Any:
+            """Call `func` with `inject` temporarily set as its globals.
+
+            Names already present in `func.__globals__` are restored and
+            new ones removed afterwards. With nothing to inject, `func` is
+            called directly without touching its globals.
+
+            Args:
+                func: Function to call.
+                args: Positional arguments for the call.
+                kwargs: Keyword arguments for the call.
+                inject: Names to expose as globals during the call.
+
+            Returns:
+                Return value from `func`.
+            """
+            if not inject:
+                return func(*args, **kwargs)
+            backup: Dict[str, Tuple[bool, Any]] = {}
+            gns: Dict[str, Any] = func.__globals__
+            try:
+                for k, v in inject.items():
+                    backup[k] = (True, gns[k]) if k in gns else (False, None)
+                    gns[k] = v
+                return func(*args, **kwargs)
+            finally:
+                for k, (had, old) in backup.items():
+                    if had:
+                        gns[k] = old
+                    else:
+                        gns.pop(k, None)
+
         @staticmethod
         def _make_adapter(
             func: Callable[..., Any],
@@ -614,7 +785,17 @@ class WizeDispatcher:
                 params to their default values.
             """
             param: MappingProxyType[str,
-                                    Parameter] = signature(func).parameters
+                                    Parameter] = _signature(func).parameters
+            positional: Tuple[str, ...] = tuple(
+                p.name for p in param.values() if p.kind in (
+                    Parameter.POSITIONAL_ONLY,
+                    Parameter.POSITIONAL_OR_KEYWORD,
+                ))
+            keyword_only: Tuple[str, ...] = tuple(
+                p.name for p in param.values()
+                if p.kind == Parameter.KEYWORD_ONLY)
+            accepts_varkw: bool = any(p.kind == Parameter.VAR_KEYWORD
+                                      for p in param.values())
 
             def adapter(*_a: Any, **all_named: Any) -> Any:
                 """Call `func`, injecting undeclared names as globals.
@@ -625,42 +806,20 @@ class WizeDispatcher:
                 """
                 kwargs_pass: Dict[str, Any] = {
                     n: all_named[n]
-                    for n in [
-                        p.name for p in param.values()
-                        if p.kind == Parameter.KEYWORD_ONLY
-                    ] if n in all_named
+                    for n in keyword_only if n in all_named
                 }
-                if any(p.kind == Parameter.VAR_KEYWORD
-                       for p in param.values()):
-                    for k, v in all_named.items():
-                        if k not in param:
-                            kwargs_pass[k] = v
-                globalns: Dict[str, Any] = func.__globals__
-                injected: Dict[str, Tuple[bool, Any]] = {}
-                try:
-                    for k, v in all_named.items():
-                        if k not in param:
-                            injected[k] = ((True,
-                                            globalns[k]) if k in globalns else
-                                           (False, None))
-                            globalns[k] = v
-                    return func(
-                        *[
-                            all_named[n] for n in [
-                                p.name for p in param.values() if p.kind in (
-                                    Parameter.POSITIONAL_ONLY,
-                                    Parameter.POSITIONAL_OR_KEYWORD,
-                                )
-                            ] if n in all_named
-                        ],
-                        **kwargs_pass,
-                    )
-                finally:
-                    for k, (had, old) in injected.items():
-                        if had:
-                            globalns[k] = old
-                        else:
-                            del globalns[k]
+                extras: Dict[str, Any] = {
+                    k: v
+                    for k, v in all_named.items() if k not in param
+                }
+                if accepts_varkw:
+                    kwargs_pass.update(extras)
+                return WizeDispatcher._BaseRegistry._call_with_globals(
+                    func,
+                    [all_named[n] for n in positional if n in all_named],
+                    kwargs_pass,
+                    extras,
+                )
 
             return update_wrapper(adapter, func), {
                 p.name: p.default
@@ -680,50 +839,48 @@ class WizeDispatcher:
             evaluates overload eligibility (including var-positional /
             var-keyword handling), scores candidates using typing-aware
             specificity, caches by a structure-aware key
-            (including *args length and **kwargs keys),
-            and invokes the chosen callable.
+            (including *args length and **kwargs keys) unless a hint
+            depends on argument contents, and invokes the chosen
+            callable.
             """
             # 1) Bind to the original signature and apply defaults.
             bound, _provided = self._bind(instance=instance,
                                           args=args,
                                           kwargs=kwargs)
 
-            # 2) Identify how the *original* signature named varargs/**kwargs.
-            orig_params_list: list[Parameter] = list(
-                self._sig.parameters.values())
-            orig_varpos_name: Optional[str] = next(
-                (p.name for p in orig_params_list
-                 if p.kind == Parameter.VAR_POSITIONAL),
-                None,
-            )
-            orig_varkw_name: Optional[str] = next(
-                (p.name
-                 for p in orig_params_list if p.kind == Parameter.VAR_KEYWORD),
-                None,
-            )
-            # Extract extras from the bound call using those names.
+            # 2) Build a *structure-aware* cache key from the original
+            # signature's precomputed *args/**kwargs names. Registries
+            # with content-dependent hints (TypedDict, List[int], ...)
+            # skip the cache: equal types do not imply the same choice.
+            arguments: Dict[str, Any] = bound.arguments
+            orig_varpos_name: Optional[str] = self._varpos_name
+            orig_varkw_name: Optional[str] = self._varkw_name
+            types_key: Optional[Tuple[Any, ...]] = None
+            if self._cacheable:
+                key_parts: list[object] = []
+                for name in self._param_order:
+                    if name == orig_varpos_name:
+                        key_parts.append(
+                            (tuple, len(arguments.get(name, ()))))
+                    elif name == orig_varkw_name:
+                        # frozenset: order-independent and exact, no sorting.
+                        key_parts.append(
+                            (dict, frozenset(arguments.get(name, ()))))
+                    else:
+                        key_parts.append(type(arguments.get(name)))
+                types_key = tuple(key_parts)
+                cached: Optional[Callable[...,
+                                          Any]] = self._cache.get(types_key)
+                if cached is not None:
+                    return self._invoke_selected(chosen=cached, bound=bound)
+
+            # 3) Extract extras from the bound call using those names.
             pos_extras_orig: tuple[Any, ...] = tuple(
-                bound.arguments.get(orig_varpos_name, (
+                arguments.get(orig_varpos_name, (
                 )) if orig_varpos_name else ())
             kw_extras_orig: Dict[str, Any] = dict(
-                bound.arguments.get(orig_varkw_name, {}
-                                    ) if orig_varkw_name else {})
-
-            # 3) Build a *structure-aware* cache key.
-            key_parts: list[object] = []
-            for name in self._param_order:
-                if name == orig_varpos_name:
-                    tup: tuple[Any, ...] = tuple(bound.arguments.get(name, ()))
-                    key_parts.append((tuple, len(tup)))
-                elif name == orig_varkw_name:
-                    d: Dict[str, Any] = dict(bound.arguments.get(name, {}))
-                    key_parts.append((dict, tuple(sorted(d.keys()))))
-                else:
-                    key_parts.append(type(bound.arguments.get(name, None)))
-            types_key: Tuple[Any, ...] = tuple(key_parts)
-            cached: Optional[Callable[..., Any]] = self._cache.get(types_key)
-            if cached is not None:
-                return self._invoke_selected(chosen=cached, bound=bound)
+                arguments.get(orig_varkw_name, {}
+                              ) if orig_varkw_name else {})
 
             # 4) Evaluate each registered overload.
             keys: Tuple[str, ...] = self._param_order
@@ -731,7 +888,7 @@ class WizeDispatcher:
             best_func: Optional[Callable[..., Any]] = None
             for ov in self._overloads:
                 func: Callable[..., Any] = ov._func
-                params: MappingProxyType[str, Parameter] = signature(
+                params: MappingProxyType[str, Parameter] = _signature(
                     func).parameters
                 params_list: list[Parameter] = list(params.values())
                 # Skip receiver slot for methods/classmethods.
@@ -798,8 +955,7 @@ class WizeDispatcher:
                      if p.kind == Parameter.VAR_KEYWORD),
                     None,
                 )
-                tmap: Optional[Mapping[str, Any]] = getattr(
-                    func, "__dispatch_type_map__", None)
+                tmap: Optional[Mapping[str, Any]] = ov._type_map
 
                 def hint_for(
                     name: str,
@@ -867,7 +1023,8 @@ class WizeDispatcher:
                 if best_score is None or score > best_score:
                     best_score, best_func = score, func
             chosen: Callable[..., Any] = best_func or self._original
-            self._cache[types_key] = chosen
+            if types_key is not None:
+                self._cache[types_key] = chosen
             return self._invoke_selected(chosen=chosen, bound=bound)
 
         def _invoke_selected(
@@ -903,21 +1060,13 @@ class WizeDispatcher:
                                         or chosen)
             if orig_func is chosen:
                 return chosen(**dict(bound.arguments))
-            orig_sig: Signature = signature(orig_func)
-            orig_params: list[Parameter] = list(orig_sig.parameters.values())
+            orig_sig: Signature = _signature(orig_func)
+            orig_names: Mapping[str, Parameter] = orig_sig.parameters
+            orig_params: list[Parameter] = list(orig_names.values())
             # Names used by the original target's signature
             # (the one used to bind).
-            bind_params: list[Parameter] = list(self._sig.parameters.values())
-            bind_varpos_name: Optional[str] = next(
-                (p.name
-                 for p in bind_params if p.kind == Parameter.VAR_POSITIONAL),
-                None,
-            )
-            bind_varkw_name: Optional[str] = next(
-                (p.name
-                 for p in bind_params if p.kind == Parameter.VAR_KEYWORD),
-                None,
-            )
+            bind_varpos_name: Optional[str] = self._varpos_name
+            bind_varkw_name: Optional[str] = self._varkw_name
             pos_extras_orig: tuple[Any, ...] = tuple(
                 bound.arguments.get(bind_varpos_name, (
                 )) if bind_varpos_name else ())
@@ -976,15 +1125,12 @@ class WizeDispatcher:
             for name, val in bound.arguments.items():
                 if name in skip_names:
                     continue
-                if name not in consumed_names and name not in {
-                        p.name
-                        for p in orig_params
-                }:
+                if name not in consumed_names and name not in orig_names:
                     to_inject[name] = val
             # Also inject leftover kw_extras
             # (should be none if eligibility held)
             for k, v in kw_extras.items():
-                if k not in {p.name for p in orig_params}:
+                if k not in orig_names:
                     to_inject[k] = v
             # If bound had var-positional but overload doesn't
             # accept it, inject
@@ -997,19 +1143,8 @@ class WizeDispatcher:
             if (bind_varkw_name and bind_varkw_name in bound.arguments
                     and not has_varkw_overload):
                 to_inject.setdefault(bind_varkw_name, kw_extras_orig)
-            backup: Dict[str, Tuple[bool, Any]] = {}
-            gns: Dict[str, Any] = orig_func.__globals__
-            try:
-                for k, v in to_inject.items():
-                    backup[k] = (True, gns[k]) if k in gns else (False, None)
-                    gns[k] = v
-                return orig_func(*args_for_call, **kwargs_for_call)
-            finally:
-                for k, (had, old) in backup.items():
-                    if had:
-                        gns[k] = old
-                    else:
-                        gns.pop(k, None)
+            return self._call_with_globals(orig_func, args_for_call,
+                                           kwargs_for_call, to_inject)
 
         def register(
             self,
@@ -1023,7 +1158,10 @@ class WizeDispatcher:
             """Register an overload/fallback in this registry.
 
             Wraps `func` with the adapter, stores metadata, and clears
-            the dispatch cache.
+            the dispatch cache. The merged `type_map` is snapshotted once
+            here; dispatch reads it from the overload record. Caching is
+            switched off for the registry once any overload declares a
+            hint whose match depends on argument contents.
 
             Args:
                 func: Callable to register.
@@ -1036,11 +1174,12 @@ class WizeDispatcher:
             wrapped: Any
             defaults: Dict[str, Any]
             wrapped, defaults = self._make_adapter(func)
-            setattr(wrapped, attr_str, dict(type_map))
+            effective: Dict[str, Any] = dict(type_map)
+            setattr(wrapped, attr_str, effective)
             self._overloads.append(
                 WizeDispatcher._Overload(
                     _func=wrapped,
-                    _type_map=type_map,
+                    _type_map=effective,
                     _param_order=self._param_order,
                     _dec_keys=dec_keys,
                     _is_original=is_original,
@@ -1050,10 +1189,21 @@ class WizeDispatcher:
                 ))
             self._reg_counter += 1
             self._cache.clear()
+            if self._cacheable:
+                params: Iterable[Parameter] = _signature(
+                    wrapped).parameters.values()
+                self._cacheable = not any(
+                    TypeMatch._depends_on_value(h) for h in (
+                        *effective.values(),
+                        *(p.annotation for p in params
+                          if p.annotation is not Parameter.empty),
+                    ))
 
     class _MethodRegistry(_BaseRegistry):
         """Registry specialization for methods and property setters."""
 
+        __slots__ = ()
+
         def __init__(
             self,
             *,
@@ -1078,6 +1228,8 @@ class WizeDispatcher:
     class _FunctionRegistry(_BaseRegistry):
         """Registry specialization for top-level free functions."""
 
+        __slots__ = ()
+
         def __init__(
             self,
             *,
@@ -1101,10 +1253,10 @@ class WizeDispatcher:
         materialized when the owner class is finalized (`__set_name__`).
         """
 
-        _queues: Dict[
-            str,
-            list[Tuple[Callable[..., Any], Dict[str, Any], Tuple[Any, ...]]],
-        ]
+        __slots__ = ("_queues", )
+
+        _queues: Dict[str, list[Tuple[Callable[..., Any], Mapping[str, Any],
+                                      Tuple[Any, ...]]]]
 
         def __init__(self) -> None:
             """Initialize an empty queue of pending overload entries."""
@@ -1196,19 +1348,22 @@ class WizeDispatcher:
                     if not getattr(func, "__qualname__",
                                    "").startswith(owner.__qualname__ + "."):
                         continue
-                    ld: int = len(decorator_pos)
                     dec_types: Dict[str, Any] = {
-                        **{
-                            v: decorator_pos[i]
-                            for i, v in enumerate(reg._param_order) if i < ld
-                        },
+                        **dict(
+                            zip(reg._param_order, decorator_pos,
+                                strict=False)),
                         **decorator_types,
                     }
                     reg.register(
                         func=func,
                         type_map=WizeDispatcher._merge_types(
                             order=reg._param_order,
-                            decorator_types=dec_types,
+                            decorator_types=(
+                                WizeDispatcher._resolve_decorator_types(
+                                    types=dec_types,
+                                    globalns=func.__globals__,
+                                    localns=owner.__dict__,
+                                )),
                             fn_ann=WizeDispatcher._resolve_hints(
                                 func=func,
                                 globalns=func.__globals__,
@@ -1219,7 +1374,7 @@ class WizeDispatcher:
                         dec_keys=frozenset(dec_types.keys()),
                         is_original=False,
                     )
-            WizeDispatcher._pending.pop(owner.__qualname__, None)
+            WizeDispatcher._pending().pop(owner.__qualname__, None)
 
         def __get__(self, instance: Any, owner: Optional[type] = None) -> Self:
             """Return the descriptor itself (not a bound object)."""
@@ -1230,11 +1385,14 @@ class WizeDispatcher:
             *,
             target_name: str,
             func: Callable[..., Any],
-            decorator_types: Dict[str, Any],
+            decorator_types: Mapping[str, Any],
             decorator_pos: Tuple[Any, ...],
         ) -> None:
             """Queue an overload declared within a class body.
 
+            Entries are stored as given; they are only read when merged
+            into fresh type maps by `__set_name__`, so no copies are made.
+
             Args:
                 target_name: Name of the target attribute.
                 func: Function object being decorated.
@@ -1242,7 +1400,7 @@ class WizeDispatcher:
                 decorator_pos: Positional decorator types in order.
             """
             self._queues.setdefault(target_name, []).append(
-                (func, dict(decorator_types), tuple(decorator_pos)))
+                (func, decorator_types, decorator_pos))
 
     @staticmethod
     def _param_order(*, sig: Signature, skip_first: bool) -> Tuple[str, ...]:
@@ -1260,6 +1418,79 @@ class WizeDispatcher:
             params = params[1:]
         return tuple(p.name for p in params)
 
+    @staticmethod
+    def _variadic_names(
+            *, sig: Signature) -> Tuple[Optional[str], Optional[str]]:
+        """Find the names of the var-positional and var-keyword params.
+
+        Args:
+            sig: Signature of the original callable.
+
+        Returns:
+            `(varpos_name, varkw_name)`, each None when absent.
+        """
+        varpos: Optional[str] = None
+        varkw: Optional[str] = None
+        for p in sig.parameters.values():
+            if p.kind == Parameter.VAR_POSITIONAL:
+                varpos = p.name
+            elif p.kind == Parameter.VAR_KEYWORD:
+                varkw = p.name
+        return varpos, varkw
+
+    @staticmethod
+    def _make_binder(*, sig: Signature,
+                     name: str) -> Callable[..., Dict[str, Any]]:
+        """Compile a function that binds calls the way `sig` does.
+
+        The generated function declares the same parameters (kinds and
+        defaults, no annotations) and returns them as a name->value dict
+        in declaration order, i.e. what `sig.bind(...)` followed by
+        `apply_defaults()` would hold in `.arguments`. CPython's own
+        argument parsing does the binding and raises the usual
+        TypeErrors for calls that do not fit.
+
+        Args:
+            sig: Signature of the original callable.
+            name: Target name, used for the binder and its error messages.
+
+        Returns:
+            Binder accepting the original call's arguments.
+        """
+        namespace: Dict[str, Any] = {}
+        params_src: list[str] = []
+        prev_kind: Optional[Any] = None
+        for i, p in enumerate(sig.parameters.values()):
+            if (prev_kind is Parameter.POSITIONAL_ONLY
+                    and p.kind is not Parameter.POSITIONAL_ONLY):
+                params_src.append("/")
+            if p.kind is Parameter.KEYWORD_ONLY and prev_kind not in (
+                    Parameter.KEYWORD_ONLY, Parameter.VAR_POSITIONAL):
+                params_src.append("*")
+            text: str = p.name
+            if p.kind is Parameter.VAR_POSITIONAL:
+                text = "*" + text
+            elif p.kind is Parameter.VAR_KEYWORD:
+                text = "**" + text
+            if p.default is not Parameter.empty:
+                namespace[f"__default_{i}"] = p.default
+                text += f"=__default_{i}"
+            params_src.append(text)
+            prev_kind = p.kind
+        if prev_kind is Parameter.POSITIONAL_ONLY:
+            params_src.append("/")
+        fn_name: str = (name if name.isidentifier() and not iskeyword(name)
+                        else "_bind")
+        items: str = ", ".join(f"{n!r}: {n}" for n in sig.parameters)
+        # Source is built from parameter names only; defaults are bound
+        # through the namespace, never rendered.
+        exec(
+            f"def {fn_name}({', '.join(params_src)}):\n"
+            f"    return {{{items}}}\n",
+            namespace,
+        )
+        return namespace[fn_name]
+
     @staticmethod
     def _register_function_overload(
             *,
@@ -1311,13 +1542,17 @@ class WizeDispatcher:
             if not getattr(current, wrap_attr, False):
                 reg = regmap[target_name]
                 reg._original = current
-                reg._sig = signature(obj=current)
-                reg._param_order = tuple(
-                    p.name for p in signature(obj=current).parameters.values())
+                reg._sig = _signature(current)
+                reg._param_order = tuple(reg._sig.parameters)
+                reg._varpos_name, reg._varkw_name = (
+                    WizeDispatcher._variadic_names(sig=reg._sig))
+                reg._binder = WizeDispatcher._make_binder(sig=reg._sig,
+                                                          name=target_name)
                 if not reg._overloads:
                     reg._overloads = []
                     reg._cache = {}
                     reg._reg_counter = 0
+                    reg._cacheable = True
                 reg.register(
                     func=current,
                     type_map={
@@ -1339,19 +1574,16 @@ class WizeDispatcher:
                 setattr(wrapped, wrap_attr, True)
                 mod_dict[target_name] = wrapped
         reg = regmap[target_name]
-        ld: int = len(decorator_pos)
         dec_types: Dict[str, Any] = {
-            **{
-                name: decorator_pos[i]
-                for i, name in enumerate(reg._param_order) if i < ld
-            },
+            **dict(zip(reg._param_order, decorator_pos, strict=False)),
             **decorator_types,
         }
         reg.register(
             func=func,
             type_map=WizeDispatcher._merge_types(
                 order=reg._param_order,
-                decorator_types=dec_types,
+                decorator_types=WizeDispatcher._resolve_decorator_types(
+                    types=dec_types, globalns=mod_dict),
                 fn_ann=WizeDispatcher._resolve_hints(func=func,
                                                      globalns=mod_dict),
                 fallback_ann=WizeDispatcher._resolve_hints(func=reg._original,
@@ -1362,6 +1594,34 @@ class WizeDispatcher:
         )
         return mod_dict[target_name] if func.__name__ == target_name else func
 
+    @staticmethod
+    def _resolve_decorator_types(
+        *,
+        types: Mapping[str, Any],
+        globalns: Dict[str, Any],
+        localns: Optional[Mapping[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Evaluate string decorator types in the overload's namespace.
+
+        Strings such as ``"A"`` or ``"int | str"`` are resolved once, at
+        decoration, where the names they use are visible. Strings that
+        fail to evaluate are kept for dispatch-time resolution.
+
+        Args:
+            types: Decorator-provided name->type mapping.
+            globalns: Globals of the module declaring the overload.
+            localns: Optional locals (e.g., the owner class namespace).
+
+        Returns:
+            A copy of `types` with evaluable strings replaced.
+        """
+        resolved: Dict[str, Any] = dict(types)
+        for name, value in resolved.items():
+            if isinstance(value, str):
+                with suppress(Exception):
+                    resolved[name] = eval(value, globalns, localns)
+        return resolved
+
     @staticmethod
     def _resolve_hints(
         *,
@@ -1388,7 +1648,7 @@ class WizeDispatcher:
         )
         # Normalize all resolved annotations for consistent downstream handling
         with suppress(Exception):
-            return {k: TypingNormalize(v) for k, v in raw.items()}
+            return {k: normalize(v) for k, v in raw.items()}
         return raw
 
     @staticmethod
@@ -1413,12 +1673,101 @@ class WizeDispatcher:
         Returns:
             Effective mapping name -> type.
         """
-        return {
-            name: (decorator_types[name] if name in decorator_types else
-                   (fn_ann[name] if name in fn_ann else
-                    (fallback_ann or {}).get(name, WILDCARD)))
-            for name in order
-        }
+        fb: Mapping[str, Any] = (fallback_ann
+                                 if fallback_ann is not None else _EMPTY)
+        dec_get: Callable[[str, Any], Any] = decorator_types.get
+        fn_get: Callable[[str, Any], Any] = fn_ann.get
+        fb_get: Callable[[str, Any], Any] = fb.get
+        merged: Dict[str, Any] = {}
+        for name in order:
+            # One probe per source; `_MISSING` distinguishes absent keys
+            # from keys explicitly mapped to None.
+            value: Any = dec_get(name, _MISSING)
+            if value is _MISSING:
+                value = fn_get(name, _MISSING)
+                if value is _MISSING:
+                    value = fb_get(name, WILDCARD)
+            merged[name] = value
+        return merged
+
+    @classmethod
+    def _pending(cls) -> Dict[str, "WizeDispatcher._OverloadDescriptor"]:
+        """Return the calling thread's map of pending class descriptors.
+
+        Class bodies executing concurrently in different threads (e.g.,
+        threaded imports) each queue overloads in their own map.
+
+        Returns:
+            Mapping owner qualname -> descriptor awaiting `__set_name__`.
+        """
+        pending: Optional[Dict[str, WizeDispatcher._OverloadDescriptor]] = (
+            getattr(cls._pending_tls, "map", None))
+        if pending is None:
+            pending = cls._pending_tls.map = {}
+        return pending
+
+    @staticmethod
+    def _extract_func(obj: Any) -> Any:
+        """Return underlying function for class/static methods.
+
+        Matches on the exact type, so subclasses of classmethod or
+        staticmethod are passed through unchanged.
+
+        Args:
+            obj: A function, classmethod, or staticmethod.
+
+        Returns:
+            The raw function object.
+        """
+        return (obj.__func__
+                if type(obj) in WizeDispatcher._METHOD_WRAPPERS else obj)
+
+    def _queue_or_register(
+        self,
+        func: Callable[..., Any],
+        *,
+        target_name: str,
+        decorator_types: Mapping[str, Any],
+        decorator_pos: Tuple[Any, ...],
+    ) -> Any:
+        """Queue or immediately register an overload.
+
+        Inside class bodies, queue until owner is created. For free
+        functions, register immediately.
+
+        Args:
+            func: Function (or class/static method) being decorated.
+            target_name: Name of the attribute/function to overload.
+            decorator_types: Mapping of explicit decorator types.
+            decorator_pos: Positional decorator types.
+
+        Returns:
+            Descriptor for class scope or registered function.
+        """
+        func = self._extract_func(func)
+        head: str
+        sep: str
+        head, sep, _ = getattr(func, "__qualname__", "").partition(".")
+        if sep:
+            owner_qual: str = head
+            pending: Dict[str, WizeDispatcher._OverloadDescriptor] = (
+                self._pending())
+            desc: Any = pending.get(owner_qual)
+            if desc is None:
+                desc = pending[owner_qual] = self._OverloadDescriptor()
+            desc._add(
+                target_name=target_name,
+                func=func,
+                decorator_types=decorator_types,
+                decorator_pos=decorator_pos,
+            )
+            return desc
+        return self._register_function_overload(
+            target_name=target_name,
+            func=func,
+            decorator_types=decorator_types,
+            decorator_pos=decorator_pos,
+        )
 
     def __getattr__(self, target_name: str):
         """Return a decorator factory bound to `target_name`.
@@ -1435,18 +1784,6 @@ class WizeDispatcher:
             A decorator or a decorator factory depending on usage.
         """
 
-        def _extract_func(obj: Any) -> Any:
-            """Return underlying function for class/static methods.
-
-            Args:
-                obj: A function, classmethod, or staticmethod.
-
-            Returns:
-                The raw function object.
-            """
-            return obj.__func__ if isinstance(obj, (classmethod,
-                                                    staticmethod)) else obj
-
         def _decorator_factory(*decorator_args: Any, **decorator_kwargs: Any):
             """Create a decorator that registers an overload.
 
@@ -1461,62 +1798,22 @@ class WizeDispatcher:
                 A descriptor (class scope) or possibly replaced function
                 (free function scope).
             """
-
-            def _queue_or_register(
-                *,
-                func: Callable[..., Any],
-                decorator_types: Dict[str, Any],
-                decorator_pos: Tuple[Any, ...],
-            ):
-                """Queue or immediately register an overload.
-
-                Inside class bodies, queue until owner is created.
-                For free functions, register immediately.
-
-                Args:
-                    func: Function being decorated.
-                    decorator_types: Mapping of explicit decorator types.
-                    decorator_pos: Positional decorator types.
-
-                Returns:
-                    Descriptor for class scope or registered function.
-                """
-                qual: str = getattr(func, "__qualname__", "")
-                if "." in qual:
-                    owner_qual: str = qual.split(".", 1)[0]
-                    desc: Any = WizeDispatcher._pending.get(owner_qual)
-                    if desc is None:
-                        desc = self._OverloadDescriptor()
-                        WizeDispatcher._pending[owner_qual] = desc
-                    desc._add(
-                        target_name=target_name,
-                        func=func,
-                        decorator_types=dict(decorator_types),
-                        decorator_pos=tuple(decorator_pos),
-                    )
-                    return desc
-                return self._register_function_overload(
-                    target_name=target_name,
-                    func=func,
-                    decorator_types=dict(decorator_types),
-                    decorator_pos=tuple(decorator_pos),
-                )
-
             # Bare decorator usage: @dispatch.name
             if (len(decorator_args) == 1 and not decorator_kwargs
                     and (hasattr(decorator_args[0], "__code__")
-                         or isinstance(decorator_args[0],
-                                       (classmethod, staticmethod)))):
-                return _queue_or_register(
-                    func=_extract_func(decorator_args[0]),
+                         or type(decorator_args[0]) in self._METHOD_WRAPPERS)):
+                return self._queue_or_register(
+                    decorator_args[0],
+                    target_name=target_name,
                     decorator_types={},
                     decorator_pos=(),
                 )
             # Decorator with args: @dispatch.name(...), returns real decorator.
-            return lambda func: _queue_or_register(
-                func=_extract_func(func),
+            return partial(
+                self._queue_or_register,
+                target_name=target_name,
                 decorator_types=decorator_kwargs,
-                decorator_pos=tuple(decorator_args),
+                decorator_pos=decorator_args,
             )
 
         return _decorator_factory
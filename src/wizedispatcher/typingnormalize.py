@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import builtins
 import typing
 from collections import ChainMap as CollChainMap
 from collections import Counter as CollCounter
@@ -30,61 +31,99 @@ from collections.abc import Set as AbcSet
 from collections.abc import Sized as AbcSized
 from collections.abc import ValuesView as AbcValuesView
 from contextlib import suppress
+from functools import lru_cache
 from re import Match as ReMatch
 from re import Pattern as RePattern
-from types import UnionType
+from types import MappingProxyType, UnionType
 from typing import (
-    AbstractSet,
     Annotated,
     Any,
-    AsyncContextManager,
-    AsyncIterable,
-    AsyncIterator,
-    Awaitable,
-    ByteString,
     Callable,
-    ChainMap,
     ClassVar,
-    Collection,
     Concatenate,
-    Container,
-    Coroutine,
-    Counter,
-    DefaultDict,
-    Deque,
     Dict,
     ForwardRef,
     FrozenSet,
-    Generator,
-    Hashable,
-    ItemsView,
-    Iterable,
-    Iterator,
-    KeysView,
     List,
     Literal,
-    Mapping,
-    MappingView,
-    Match,
-    MutableMapping,
-    MutableSequence,
-    Optional,
-    OrderedDict,
     ParamSpec,
-    Pattern,
-    Reversible,
-    Sequence,
     Set,
-    Sized,
     Tuple,
-    Type,
     TypeVar,
     Union,
-    ValuesView,
     get_args,
     get_origin,
 )
 
+# typing_extensions backports define their own TypeVar/ParamSpec classes.
+_TYPEVAR_TYPES: Tuple[type, ...] = (TypeVar, )
+_PARAMSPEC_TYPES: Tuple[type, ...] = (ParamSpec, )
+with suppress(ImportError):
+    import typing_extensions
+
+    _TYPEVAR_TYPES = tuple({TypeVar, typing_extensions.TypeVar})
+    _PARAMSPEC_TYPES = tuple({ParamSpec, typing_extensions.ParamSpec})
+
+
+def _is_typevar(obj: object) -> bool:
+    """Return True if obj appears to be a TypeVar.
+
+    Args:
+      obj: Object to test.
+
+    Returns:
+      True if obj behaves like a TypeVar, else False.
+    """
+    return isinstance(obj, _TYPEVAR_TYPES)
+
+
+def _is_paramspec(obj: object) -> bool:
+    """Return True if obj appears to be a ParamSpec.
+
+    Args:
+      obj: Object to test.
+
+    Returns:
+      True if obj behaves like a ParamSpec, else False.
+    """
+    return isinstance(obj, _PARAMSPEC_TYPES)
+
+
+def _is_union_like(tp: object) -> bool:
+    """Return True if ``tp`` is a typing or PEP 604 union.
+
+    Args:
+      tp: Type expression to inspect.
+
+    Returns:
+      True if union-like, else False.
+    """
+    return get_origin(tp) is Union or isinstance(tp, UnionType)
+
+
+def _is_callable_origin(origin: object | None) -> bool:
+    """Return True if origin corresponds to collections.abc.Callable.
+
+    Args:
+      origin: Value from typing.get_origin(...).
+
+    Returns:
+      True if it is the Callable origin, else False.
+    """
+    return origin is AbcCallable
+
+
+def _is_concatenate(tp: object) -> bool:
+    """Return True if ``tp`` is typing.Concatenate[...].
+
+    Args:
+      tp: Type expression to inspect.
+
+    Returns:
+      True if it is a Concatenate, else False.
+    """
+    return get_origin(tp) is Concatenate
+
 
 class TypingNormalize:
     """Normalize annotations to canonical typing.* constructs.
@@ -104,7 +143,7 @@ class TypingNormalize:
       * Generic arguments are normalized recursively.
     """
 
-    _ORIGIN_TO_TYPING: Dict[object, str] = {
+    _ORIGIN_TO_TYPING: MappingProxyType[object, str] = MappingProxyType({
         # PEP 585 builtins
         list: "List",
         dict: "Dict",
@@ -144,47 +183,165 @@ class TypingNormalize:
         # regex runtime → typing
         RePattern: "Pattern",
         ReMatch: "Match",
+    })
+    # Bare typing generics, built by name so the typing aliases need not be
+    # imported one by one.
+    _TYPING_NAMES: Tuple[str, ...] = (
+        "List",
+        "Dict",
+        "Set",
+        "FrozenSet",
+        "Tuple",
+        "Type",
+        "Deque",
+        "DefaultDict",
+        "OrderedDict",
+        "Counter",
+        "ChainMap",
+        "Mapping",
+        "MutableMapping",
+        "Sequence",
+        "MutableSequence",
+        "Iterable",
+        "Iterator",
+        "Collection",
+        "AbstractSet",
+        "ByteString",
+        "Reversible",
+        "Sized",
+        "Container",
+        "Hashable",
+        "Awaitable",
+        "Coroutine",
+        "AsyncIterable",
+        "AsyncIterator",
+        "Generator",
+        "MappingView",
+        "KeysView",
+        "ItemsView",
+        "ValuesView",
+        "AsyncContextManager",
+        "Pattern",
+        "Match",
+        "Callable",
+        "Union",
+    )
+    _TYPING_MAP: MappingProxyType[object, str] = MappingProxyType({
+        getattr(typing, name): name
+        for name in _TYPING_NAMES
+    })
+    # Default subscript args per standardized name; () keeps it bare.
+    _DEFAULT_ARGS: Dict[str, Tuple[object, ...]] = {
+        "List": (Any, ),
+        "Dict": (Any, Any),
+        "Set": (Any, ),
+        "FrozenSet": (Any, ),
+        "Tuple": (Any, Ellipsis),
+        "Type": (Any, ),
+        "Deque": (Any, ),
+        "DefaultDict": (Any, Any),
+        "OrderedDict": (Any, Any),
+        "Counter": (Any, ),
+        "ChainMap": (Any, Any),
+        "Mapping": (Any, Any),
+        "MutableMapping": (Any, Any),
+        "Iterable": (Any, ),
+        "Iterator": (Any, ),
+        "AsyncIterable": (Any, ),
+        "AsyncIterator": (Any, ),
+        "Sequence": (Any, ),
+        "MutableSequence": (Any, ),
+        "Collection": (Any, ),
+        "AbstractSet": (Any, ),
+        "Reversible": (Any, ),
+        "ContextManager": (Any, ),
+        "AsyncContextManager": (Any, ),
+        "Pattern": (Any, ),
+        "Match": (Any, ),
+        "Coroutine": (Any, Any, Any),
+        "Generator": (Any, Any, Any),
+        "Callable": (Ellipsis, Any),
+        "ByteString": (),
+        "Sized": (),
+        "Container": (),
+        "Hashable": (),
+        "Awaitable": (),
+        "MappingView": (),
+        "KeysView": (),
+        "ItemsView": (),
+        "ValuesView": (),
+    }
+    # Fully defaulted typing object per standardized name, built once.
+    _NAME_TO_DEFAULT: Dict[str, object] = {
+        **{
+            name: (getattr(typing, name)[args]
+                   if args else getattr(typing, name))
+            for name, args in _DEFAULT_ARGS.items()
+        },
+        "Union": Any,
     }
-    _TYPING_MAP: Dict[object, str] = {
-        List: "List",
-        Dict: "Dict",
-        Set: "Set",
-        FrozenSet: "FrozenSet",
-        Tuple: "Tuple",
-        Type: "Type",
-        Deque: "Deque",
-        DefaultDict: "DefaultDict",
-        OrderedDict: "OrderedDict",
-        Counter: "Counter",
-        ChainMap: "ChainMap",
-        Mapping: "Mapping",
-        MutableMapping: "MutableMapping",
-        Sequence: "Sequence",
-        MutableSequence: "MutableSequence",
-        Iterable: "Iterable",
-        Iterator: "Iterator",
-        Collection: "Collection",
-        AbstractSet: "AbstractSet",
-        ByteString: "ByteString",
-        Reversible: "Reversible",
-        Sized: "Sized",
-        Container: "Container",
-        Hashable: "Hashable",
-        Awaitable: "Awaitable",
-        Coroutine: "Coroutine",
-        AsyncIterable: "AsyncIterable",
-        AsyncIterator: "AsyncIterator",
-        Generator: "Generator",
-        MappingView: "MappingView",
-        KeysView: "KeysView",
-        ItemsView: "ItemsView",
-        ValuesView: "ValuesView",
-        AsyncContextManager: "AsyncContextManager",
-        Pattern: "Pattern",
-        Match: "Match",
-        Callable: "Callable",
-        Union: "Union",
+    # Bare runtime builtins/ABCs and bare typing generics -> defaults.
+    # (zip/map instead of comprehensions: class names are not visible
+    # inside comprehension scopes.)
+    _RUNTIME_DEFAULTS: Dict[object, object] = {
+        **dict(
+            zip(
+                _ORIGIN_TO_TYPING,
+                map(_NAME_TO_DEFAULT.__getitem__, _ORIGIN_TO_TYPING.values()),
+                strict=True,
+            )),
+        AbcCallable: _NAME_TO_DEFAULT["Callable"],
+        callable: _NAME_TO_DEFAULT["Callable"],
     }
+    # Keyed by id(): the typing aliases are module singletons that live
+    # for the whole process, and an int key skips hashing ``tp``.
+    _TYPING_DEFAULTS_BY_ID: Dict[int, object] = dict(
+        zip(
+            map(id, _TYPING_MAP),
+            map(_NAME_TO_DEFAULT.__getitem__, _TYPING_MAP.values()),
+            strict=True,
+        ))
+    # Annotations that are already canonical and need no normalization.
+    _SCALAR_PASSTHROUGH: FrozenSet[object] = frozenset({
+        int,
+        str,
+        bytes,
+        float,
+        bool,
+        complex,
+        bytearray,
+        object,
+        type(None),
+        None,
+        Any,
+        Ellipsis,
+    })
+    # Special forms whose subscription shape differs from plain generics.
+    _ORIGIN_HANDLERS: Dict[object, Callable[[Tuple[object, ...]], object]] = {
+        # ClassVar expects a single type argument
+        ClassVar: lambda a: ClassVar[a[0]] if a else ClassVar,
+        # Annotated accepts (type, *metadata)
+        Annotated: lambda a: Annotated[a],
+        # Literal accepts a variadic list of literal values
+        Literal: lambda a: Literal[a],
+    }
+    # Origin -> constructor taking the normalized args tuple: the typing
+    # alias' own __getitem__, or a special-form handler.
+    _ORIGIN_BUILDERS: Dict[object, Callable[[Tuple[object, ...]], object]] = {
+        **{
+            origin: getattr(typing, name).__getitem__
+            for origin, name in _ORIGIN_TO_TYPING.items()
+        },
+        **_ORIGIN_HANDLERS,
+    }
+    # Type names accepted in string annotations: builtins plus None aliases.
+    _STRING_TYPES: Dict[str, object] = {
+        **vars(builtins),
+        "None": type(None),
+        "NoneType": type(None),
+    }
+    # Interned ``_tsub`` results keyed by (typing_name, hashable args).
+    _TSUB_CACHE: Dict[Tuple[object, ...], object] = {}
 
     def __new__(cls, tp: object) -> object:
         """Return the normalized typing form of ``tp``.
@@ -199,183 +356,287 @@ class TypingNormalize:
 
     # -------------------- detection helpers --------------------
 
+    # Module-level predicates are called directly on the hot path; these
+    # aliases keep them reachable as TypingNormalize attributes.
+    _is_typevar = staticmethod(_is_typevar)
+    _is_paramspec = staticmethod(_is_paramspec)
+    _is_union_like = staticmethod(_is_union_like)
+    _is_callable_origin = staticmethod(_is_callable_origin)
+    _is_concatenate = staticmethod(_is_concatenate)
+
     @staticmethod
-    def _is_typevar(obj: object) -> bool:
-        """Return True if obj appears to be a TypeVar.
+    def _string_to_type(type_name: str) -> object:
+        """Convert a string type name to the actual type object.
 
         Args:
-          obj: Object to test.
+          type_name: String representation of a type (e.g., "int", "str").
 
         Returns:
-          True if obj behaves like a TypeVar, else False.
+          The actual type object if found, otherwise Any.
         """
-        return hasattr(obj, "__constraints__") and (obj.__class__.__name__
-                                                    == "TypeVar")
+        return TypingNormalize._STRING_TYPES.get(type_name, Any)
 
     @staticmethod
-    def _is_paramspec(obj: object) -> bool:
-        """Return True if obj appears to be a ParamSpec.
+    def _resolve_forward_ref(forward_ref: ForwardRef) -> object:
+        """Resolve a ForwardRef to its actual type.
 
         Args:
-          obj: Object to test.
+          forward_ref: A ForwardRef object.
 
         Returns:
-          True if obj behaves like a ParamSpec, else False.
+          The resolved type object if possible, otherwise Any.
         """
-        return (hasattr(obj, "args") and hasattr(obj, "kwargs")
-                and (obj.__class__.__name__ == "ParamSpec"))
+        arg: object = getattr(forward_ref, "__forward_arg__", None)
+        return (TypingNormalize._string_to_type(arg)
+                if isinstance(arg, str) else Any)
+
+    # Type[...] argument resolvers keyed by the argument's exact type.
+    _TYPE_ARG_HANDLERS: Dict[type, Callable[[Any], object]] = {
+        str: _string_to_type,
+        ForwardRef: _resolve_forward_ref,
+    }
+
+    @classmethod
+    def cache_clear(cls) -> None:
+        """Drop all memoized normalization results."""
+        _norm_cached.cache_clear()
+        cls._TSUB_CACHE.clear()
 
     @staticmethod
-    def _is_union_like(tp: object) -> bool:
-        """Return True if ``tp`` is a typing or PEP 604 union.
+    def _norm(tp: object) -> object:
+        """Normalize an annotation, memoizing hashable inputs.
+
+        The cache key pairs ``tp`` with its ordered ``__args__`` because
+        typing compares unions and literals as sets; ``tp`` alone would
+        hand ``Union[str, int]`` the cached ``Union[int, str]``.
 
         Args:
-          tp: Type expression to inspect.
+          tp: Any annotation or runtime type.
 
         Returns:
-          True if union-like, else False.
+          A typing.* object where generics and unions are normalized.
         """
-        return get_origin(tp) is Union or isinstance(tp, UnionType)
+        # Plain classes map straight to their typing default, or are
+        # already normal; bare typing generics are one id() lookup.
+        if type(tp) is type:
+            return TypingNormalize._RUNTIME_DEFAULTS.get(tp, tp)
+        defaulted: object | None = TypingNormalize._TYPING_DEFAULTS_BY_ID.get(
+            id(tp))
+        if defaulted is not None:
+            return defaulted
+        try:
+            if tp in TypingNormalize._SCALAR_PASSTHROUGH:
+                return tp
+            return _norm_cached(tp, getattr(tp, "__args__", None))
+        except TypeError:
+            # Unhashable input (e.g., a Callable parameter list).
+            return TypingNormalize._norm_uncached(tp)
 
     @staticmethod
-    def _is_callable_origin(origin: object | None) -> bool:
-        """Return True if origin corresponds to collections.abc.Callable.
+    def _norm_uncached(tp: object) -> object:
+        """Normalize any annotation to canonical typing constructs.
 
         Args:
-          origin: Value from typing.get_origin(...).
+          tp: Any annotation or runtime type.
 
         Returns:
-          True if it is the Callable origin, else False.
+          A typing.* object where generics and unions are normalized.
         """
-        return origin is AbcCallable
+        # TypeVar/ParamSpec dispatch on the exact class of ``tp``.
+        by_type: Callable[[Any], object] | None = (
+            TypingNormalize._NORM_BY_TYPE.get(type(tp)))
+        if by_type is not None:
+            return by_type(tp)
+        # Bare typing generics (e.g., List, Dict, Type) → defaults
+        defaulted: object | None = TypingNormalize._plain_typing_to_defaults(
+            tp)
+        if defaulted is not None:
+            return defaulted
+        # Origin and args are read once and handed to the origin handler.
+        origin: object | None = get_origin(tp)
+        if origin is None:
+            return TypingNormalize._plain_runtime_to_typing(tp)
+        handler: Callable[[Any, Tuple[object, ...]], object] = (
+            TypingNormalize._NORM_BY_ORIGIN.get(
+                origin, TypingNormalize._norm_generic))
+        return handler(origin, get_args(tp))
 
     @staticmethod
-    def _is_concatenate(tp: object) -> bool:
-        """Return True if ``tp`` is typing.Concatenate[...].
+    def _norm_typevar(tp: TypeVar) -> object:
+        """Normalize a TypeVar to its constraints, bound, or Any.
 
         Args:
-          tp: Type expression to inspect.
+          tp: The TypeVar.
 
         Returns:
-          True if it is a Concatenate, else False.
+          A Union of the constraints, the normalized bound, or Any.
         """
-        return get_origin(tp) is Concatenate
+        # Every TypeVar (typing's and typing_extensions') defines both.
+        constraints: Tuple[object, ...] = tp.__constraints__
+        if constraints:
+            return TypingNormalize._to_union(*constraints)
+        bound: object | None = tp.__bound__
+        return Any if bound is None else TypingNormalize._norm(bound)
 
     @staticmethod
-    def _string_to_type(type_name: str) -> object:
-        """Convert a string type name to the actual type object.
+    def _norm_paramspec(_tp: ParamSpec) -> object:
+        """Normalize a ParamSpec, which carries no usable type, to Any.
 
         Args:
-          type_name: String representation of a type (e.g., "int", "str").
+          _tp: The ParamSpec.
 
         Returns:
-          The actual type object if found, otherwise Any.
+          typing.Any.
         """
-        # Common builtin types
-        builtin_types = {
-            "int": int,
-            "str": str,
-            "bytes": bytes,
-            "float": float,
-            "bool": bool,
-            "complex": complex,
-            "list": list,
-            "dict": dict,
-            "set": set,
-            "frozenset": frozenset,
-            "tuple": tuple,
-            "type": type,
-            "object": object,
-            "None": type(None),
-            "NoneType": type(None),
-        }
-        # Try to get from builtins first
-        if type_name in builtin_types:
-            return builtin_types[type_name]
-        # Try to get from globals (for user-defined types)
-        with suppress(ImportError, AttributeError):
-            import builtins
-
-            if hasattr(builtins, type_name):
-                return getattr(builtins, type_name)
-        # If we can't resolve the type, return Any
         return Any
 
     @staticmethod
-    def _resolve_forward_ref(forward_ref: ForwardRef) -> object:
-        """Resolve a ForwardRef to its actual type.
+    def _norm_union(_origin: object, args: Tuple[object, ...]) -> object:
+        """Normalize a typing or PEP 604 union from its members.
 
         Args:
-          forward_ref: A ForwardRef object.
+          _origin: Union or types.UnionType.
+          args: The union members.
 
         Returns:
-          The resolved type object if possible, otherwise Any.
+          The normalized union, single member, or Any.
         """
-        with suppress(ImportError, AttributeError):
-            return TypingNormalize._string_to_type(forward_ref.__forward_arg__)
-        return Any
+        return TypingNormalize._to_union(*args)
 
     @staticmethod
-    def _norm(tp: object) -> object:
-        """Normalize any annotation to canonical typing constructs.
+    def _norm_callable(_origin: object, args: Tuple[object, ...]) -> object:
+        """Normalize a Callable; ParamSpec/Concatenate become ``...``.
 
         Args:
-          tp: Any annotation or runtime type.
+          _origin: collections.abc.Callable.
+          args: ``(params, ret)`` as returned by get_args.
 
         Returns:
-          A typing.* object where generics and unions are normalized.
+          A typing.Callable with normalized parameters and return type.
         """
-        if TypingNormalize._is_typevar(tp):
-            constraints: Tuple[object, ...] = getattr(tp, "__constraints__",
-                                                      ())
-            if constraints:
-                return TypingNormalize._to_union(*constraints)
-            bound: object | None = getattr(tp, "__bound__", None)
-            return Any if bound is None else TypingNormalize._norm(bound)
-        if TypingNormalize._is_paramspec(tp):
-            return Any
-        if TypingNormalize._is_union_like(tp):
-            return TypingNormalize._to_union(*get_args(tp))
-        # Bare typing generics (e.g., List, Dict, Type) → defaults
-        defaulted: object | None = TypingNormalize._plain_typing_to_defaults(
-            tp)
-        if defaulted is not None:
-            return defaulted
-        origin: object | None = get_origin(tp)
-        if TypingNormalize._is_callable_origin(origin):
-            params_ret: Tuple[object, ...] = get_args(tp)
-            if len(params_ret) != 2:
-                return Callable[..., Any]
-            params: object = params_ret[0]
-            ret: object = TypingNormalize._norm(params_ret[1])
-            return (TypingNormalize._tsub(
-                "Callable",
-                ([TypingNormalize._norm(p) for p in params], ret),
-            ) if isinstance(params, list) else TypingNormalize._tsub(
-                "Callable", (Ellipsis, ret)))
-        # Handle Type annotations - convert strings/ForwardRefs but preserve
-        # actual class objects
-        if origin is type:
-            args: Tuple[object, ...] = get_args(tp)
-            if len(args) == 1:
-                arg = args[0]
-                if isinstance(arg, str):
-                    # Convert string to actual type if possible
-                    normalized_arg = TypingNormalize._string_to_type(arg)
-                    return TypingNormalize._tsub("Type", (normalized_arg, ))
-                elif isinstance(arg, ForwardRef):
-                    # Convert ForwardRef to actual type if possible
-                    normalized_arg = TypingNormalize._resolve_forward_ref(arg)
-                    return TypingNormalize._tsub("Type", (normalized_arg, ))
-                else:
-                    # Preserve actual class objects (e.g., Type[custom_class])
-                    # Just normalize the class object itself if it's a generic
-                    normalized_arg = TypingNormalize._norm(arg)
-                    return TypingNormalize._tsub("Type", (normalized_arg, ))
-        return (TypingNormalize._plain_runtime_to_typing(tp)
-                if origin is None else TypingNormalize._from_origin(
-                    origin,
-                    tuple(TypingNormalize._norm(a) for a in get_args(tp))))
+        if len(args) != 2:
+            return Callable[..., Any]
+        params: object = args[0]
+        if isinstance(params, list):
+            # Parameters and return type share one iterative pass.
+            return TypingNormalize._build_callable(
+                TypingNormalize._norm_args((*params, args[1])))
+        ret: object = TypingNormalize._norm(args[1])
+        return TypingNormalize._tsub("Callable", (Ellipsis, ret))
+
+    @staticmethod
+    def _norm_type(origin: object, args: Tuple[object, ...]) -> object:
+        """Normalize ``Type[X]``, resolving string and ForwardRef targets.
+
+        Class objects are preserved (e.g., Type[custom_class]) and only
+        normalized if they are generics.
+
+        Args:
+          origin: The builtin ``type``.
+          args: The Type arguments.
+
+        Returns:
+          typing.Type[...] with a resolved argument.
+        """
+        if len(args) != 1:
+            return TypingNormalize._norm_generic(origin, args)
+        arg: object = args[0]
+        resolve: Callable[[Any], object] = (
+            TypingNormalize._TYPE_ARG_HANDLERS.get(type(arg),
+                                                   TypingNormalize._norm))
+        return TypingNormalize._tsub("Type", (resolve(arg), ))
+
+    @staticmethod
+    def _norm_generic(origin: object, args: Tuple[object, ...]) -> object:
+        """Normalize a plain parameterized generic.
+
+        Args:
+          origin: The origin returned by typing.get_origin(...).
+          args: The raw generic arguments.
+
+        Returns:
+          A typing.* object rebuilt from normalized arguments.
+        """
+        return TypingNormalize._from_origin(origin,
+                                            TypingNormalize._norm_args(args))
+
+    # Per-node handlers, keyed by the exact class of ``tp`` and by origin.
+    _NORM_BY_TYPE: Dict[type, Callable[[Any], object]] = {
+        **dict.fromkeys(_TYPEVAR_TYPES, _norm_typevar),
+        **dict.fromkeys(_PARAMSPEC_TYPES, _norm_paramspec),
+    }
+    _NORM_BY_ORIGIN: Dict[object, Callable[..., object]] = {
+        Union: _norm_union,
+        UnionType: _norm_union,
+        AbcCallable: _norm_callable,
+        type: _norm_type,
+    }
+
+    @staticmethod
+    def _norm_args(args: Tuple[object, ...]) -> Tuple[object, ...]:
+        """Normalize generic arguments without recursing per nesting level.
+
+        Plain parameterized generics (e.g., ``Dict[str, List[int]]``) and
+        Callables with a parameter list are expanded on an explicit
+        post-order stack and rebuilt bottom-up; every other argument goes
+        through `_norm`.
+
+        Args:
+          args: Arguments of a parameterized generic.
+
+        Returns:
+          The normalized arguments, in order; ``args`` itself when every
+          argument was already normal.
+        """
+        # Results keyed by id(); every node stays alive through ``args``.
+        done: Dict[int, object] = {}
+        stack: List[Tuple[object, Tuple[object, ...] | None]] = [
+            (a, None) for a in reversed(args)
+        ]
+        while stack:
+            tp, kids = stack.pop()
+            if kids is not None:
+                origin = get_origin(tp)
+                built: Tuple[object, ...] = tuple(done[id(k)] for k in kids)
+                done[id(tp)] = (TypingNormalize._build_callable(built)
+                                if origin is AbcCallable else
+                                TypingNormalize._from_origin(origin, built))
+                continue
+            if id(tp) in done:
+                continue
+            origin: object | None = get_origin(tp)
+            sub: Tuple[object, ...] = ()
+            if origin is AbcCallable:
+                # Callable[[P1, P2], R] expands to (P1, P2, R)
+                cargs: Tuple[object, ...] = get_args(tp)
+                if len(cargs) == 2 and isinstance(cargs[0], list):
+                    sub = (*cargs[0], cargs[1])
+            elif (origin is not None
+                  and origin not in TypingNormalize._NORM_BY_ORIGIN):
+                sub = get_args(tp)
+            if not sub:
+                done[id(tp)] = TypingNormalize._norm(tp)
+                continue
+            stack.append((tp, sub))
+            stack.extend((k, None) for k in reversed(sub))
+        for a in args:
+            if done[id(a)] is not a:
+                return tuple(done[id(k)] for k in args)
+        return args
+
+    @staticmethod
+    def _build_callable(params_ret: Tuple[object, ...]) -> object:
+        """Build ``Callable[[params...], ret]`` from normalized parts.
+
+        Args:
+          params_ret: Normalized parameter types followed by the return
+            type.
+
+        Returns:
+          A typing.Callable with an explicit parameter list.
+        """
+        return TypingNormalize._tsub("Callable",
+                                     (list(params_ret[:-1]), params_ret[-1]))
 
     @staticmethod
     def _to_union(*parts: object) -> object:
@@ -388,44 +649,32 @@ class TypingNormalize:
           A flattened typing.Union[...] with None first if present, or a
           single member type if only one remains.
         """
-        flat: List[object] = TypingNormalize._explode(parts)
-        seen: Set[object] = set()
-        uniq: List[object] = []
+        # Normalize each part once; a normalized union is already flat, so
+        # its members are spliced in as-is. dict.fromkeys then dedupes in
+        # insertion order in a single C-level pass.
+        flat: List[object] = []
+        for part in parts:
+            it: object = TypingNormalize._norm(part)
+            if _is_union_like(it):
+                flat.extend(get_args(it))
+            else:
+                flat.append(it)
+        members: Dict[object, None] = dict.fromkeys(flat)
+        if Any in members:
+            return Any
         none_t: type = type(None)
-        has_none: bool = False
-        for p in flat:
-            if p is none_t:
-                has_none = True
-            if p not in seen:
-                seen.add(p)
-                uniq.append(p)
-        if not uniq or Any in uniq:
+        uniq: List[object]
+        if none_t in members:
+            del members[none_t]
+            uniq = [none_t, *members]
+        else:
+            uniq = list(members)
+        if not uniq:
             return Any
-        if has_none:
-            uniq = [none_t] + [x for x in uniq if x is not none_t]
         if len(uniq) == 1:
             return uniq[0]
         return TypingNormalize._tsub("Union", tuple(uniq))
 
-    @staticmethod
-    def _explode(items: Tuple[object, ...]) -> List[object]:
-        """Flatten nested union-like structures.
-
-        Args:
-          items: Candidate types which may contain unions.
-
-        Returns:
-          A flat list of normalized, non-union parts.
-        """
-        out: List[object] = []
-        for it in items:
-            itn: object = TypingNormalize._norm(it)
-            if TypingNormalize._is_union_like(itn):
-                out.extend(TypingNormalize._explode(get_args(itn)))
-            else:
-                out.append(itn)
-        return out
-
     @staticmethod
     def _from_origin(origin: object, args: Tuple[object, ...]) -> object:
         """Build a typing.* type from an origin and normalized args.
@@ -437,31 +686,20 @@ class TypingNormalize:
         Returns:
           A typing.* object (e.g., typing.List[T]) built from the origin.
         """
-        # Handle typing special forms that require specific subscription shapes
-        if origin is ClassVar:
-            # ClassVar expects a single type argument
-            if not args:
-                return ClassVar
-            return ClassVar[args[0]]  # type: ignore[index]
-        if origin is Annotated:
-            # Annotated accepts (type, *metadata)
-            return Annotated[args]  # type: ignore[index]
-        if origin is Literal:
-            # Literal accepts a variadic list of literal values
-            return Literal[args]  # type: ignore[index]
-
-        name: str | None = TypingNormalize._ORIGIN_TO_TYPING.get(origin)
-        if name is None:
+        builder: Callable[[Tuple[object, ...]], object] | None = (
+            TypingNormalize._ORIGIN_BUILDERS.get(origin))
+        if builder is None:
             # Fallback: construct using the origin directly if it supports
             # subscription
             try:
                 return origin[args]  # type: ignore[index]
             except Exception:
                 return origin
-        return ((TypingNormalize._tsub("Tuple",
-                                       tuple(args[:-1]) + (Ellipsis, )))
-                if name == "Tuple" and args and args[-1] is Ellipsis else
-                TypingNormalize._tsub(name, args))
+        try:
+            return builder(args)
+        except TypeError as exc:
+            raise ValueError(
+                f"Cannot subscript {origin!r} with {args!r}") from exc
 
     @staticmethod
     def _plain_runtime_to_typing(tp: object) -> object:
@@ -473,23 +711,7 @@ class TypingNormalize:
         Returns:
           A typing.* type with default Any params, or the input if unknown.
         """
-        if tp is list:
-            return TypingNormalize._tsub("List", (Any, ))
-        if tp is dict:
-            return TypingNormalize._tsub("Dict", (Any, Any))
-        if tp is set:
-            return TypingNormalize._tsub("Set", (Any, ))
-        if tp is frozenset:
-            return TypingNormalize._tsub("FrozenSet", (Any, ))
-        if tp is tuple:
-            return TypingNormalize._tsub("Tuple", (Any, Ellipsis))
-        if tp is type:
-            return TypingNormalize._tsub("Type", (Any, ))
-        if tp is AbcCallable or tp is callable:
-            return TypingNormalize._tsub("Callable", (Ellipsis, Any))
-        name: str | None = TypingNormalize._ORIGIN_TO_TYPING.get(tp)
-        return (tp if name is None else
-                TypingNormalize._typing_defaults_by_name(name))
+        return TypingNormalize._RUNTIME_DEFAULTS.get(tp, tp)
 
     @staticmethod
     def _plain_typing_to_defaults(tp: object) -> object | None:
@@ -502,69 +724,21 @@ class TypingNormalize:
           A parameterized typing.* type with Any defaults, or None if
           ``tp`` is not a bare typing generic.
         """
-        name: str | None = TypingNormalize._TYPING_MAP.get(tp)
-        return (None if name is None else
-                TypingNormalize._typing_defaults_by_name(name))
+        return TypingNormalize._TYPING_DEFAULTS_BY_ID.get(id(tp))
 
     @staticmethod
     def _typing_defaults_by_name(name: str) -> object:
-        """Build parameterized typing.* defaults by standardized name.
+        """Return parameterized typing.* defaults by standardized name.
 
         Args:
           name: Standardized typing name (e.g., 'List', 'Type').
 
         Returns:
-          A parameterized typing.* type with Any defaults.
+          A parameterized typing.* type with Any defaults, or the bare
+          typing attribute for names without known defaults.
         """
-        if name == "List":
-            return TypingNormalize._tsub("List", (Any, ))
-        if name == "Dict":
-            return TypingNormalize._tsub("Dict", (Any, Any))
-        if name == "Set":
-            return TypingNormalize._tsub("Set", (Any, ))
-        if name == "FrozenSet":
-            return TypingNormalize._tsub("FrozenSet", (Any, ))
-        if name == "Tuple":
-            return TypingNormalize._tsub("Tuple", (Any, Ellipsis))
-        if name == "Type":
-            return TypingNormalize._tsub("Type", (Any, ))
-        if name == "Deque":
-            return TypingNormalize._tsub("Deque", (Any, ))
-        if name == "DefaultDict":
-            return TypingNormalize._tsub("DefaultDict", (Any, Any))
-        if name == "OrderedDict":
-            return TypingNormalize._tsub("OrderedDict", (Any, Any))
-        if name == "Counter":
-            return TypingNormalize._tsub("Counter", (Any, ))
-        if name == "ChainMap":
-            return TypingNormalize._tsub("ChainMap", (Any, Any))
-        if name in {"Mapping", "MutableMapping"}:
-            return TypingNormalize._tsub(name, (Any, Any))
-        if name in {
-                "Iterable",
-                "Iterator",
-                "AsyncIterable",
-                "AsyncIterator",
-                "Sequence",
-                "MutableSequence",
-                "Collection",
-                "AbstractSet",
-                "Reversible",
-                "ContextManager",
-                "AsyncContextManager",
-                "Pattern",
-                "Match",
-        }:
-            return TypingNormalize._tsub(name, (Any, ))
-        if name in {"Coroutine", "Generator"}:
-            return TypingNormalize._tsub(name, (Any, Any, Any))
-        if name in {"MappingView", "KeysView", "ItemsView", "ValuesView"}:
-            return getattr(typing, name)
-        if name == "Callable":
-            return TypingNormalize._tsub("Callable", (Ellipsis, Any))
-        if name == "Union":
-            return Any
-        return getattr(typing, name)
+        default: object | None = TypingNormalize._NAME_TO_DEFAULT.get(name)
+        return getattr(typing, name) if default is None else default
 
     @staticmethod
     def _tsub(typing_name: str, args: object) -> object:
@@ -581,24 +755,52 @@ class TypingNormalize:
         Raises:
           ValueError: If the arguments' shape is invalid for the target.
         """
-        if typing_name == "Union":
-            if not isinstance(args, tuple):
-                raise ValueError("Union expects a tuple of arguments.")
-            if len(args) == 0:
-                return Union
-            return Union[args]
+        key: Tuple[object, ...]
         if typing_name == "Callable":
             if not isinstance(args, tuple) or len(args) != 2:
                 raise ValueError("Callable expects (params, return).")
             params: object = args[0]
-            ret: object = args[1]
             if params is Ellipsis:
-                return getattr(typing, typing_name)[..., ret]
-            if isinstance(params, list):
-                return getattr(typing, typing_name)[params, ret]
-            raise ValueError("Callable params must be list or Ellipsis.")
-        if not isinstance(args, tuple):
-            raise ValueError("Generic expects a tuple of arguments.")
+                key = (typing_name, Ellipsis, args[1])
+            elif isinstance(params, list):
+                key = (typing_name, tuple(params), args[1])
+            else:
+                raise ValueError("Callable params must be list or Ellipsis.")
+        elif not isinstance(args, tuple):
+            raise ValueError(
+                "Union expects a tuple of arguments." if typing_name ==
+                "Union" else "Generic expects a tuple of arguments.")
+        else:
+            key = (typing_name, args)
+        cache: Dict[Tuple[object, ...], object] = TypingNormalize._TSUB_CACHE
+        try:
+            hit: object | None = cache.get(key)
+        except TypeError:
+            return TypingNormalize._tsub_build(typing_name, args)
+        if hit is None:
+            hit = cache[key] = TypingNormalize._tsub_build(typing_name, args)
+        return hit
+
+    @staticmethod
+    def _tsub_build(typing_name: str, args: Tuple[object, ...]) -> object:
+        """Subscript ``typing.<Name>`` with pre-validated ``args``.
+
+        Args:
+          typing_name: Name inside typing (e.g., 'List', 'Union').
+          args: Subscript args already checked by `_tsub`.
+
+        Returns:
+          A freshly built typing object.
+
+        Raises:
+          ValueError: If ``typing_name`` is not a subscriptable target.
+        """
+        if typing_name == "Union":
+            return Union[args] if args else Union
+        if typing_name == "Callable":
+            params: object = args[0]
+            return getattr(typing, typing_name)[
+                ... if params is Ellipsis else params, args[1]]
         try:
             return getattr(typing, typing_name)[args]
         except Exception as exc:
@@ -606,7 +808,56 @@ class TypingNormalize:
                 f"Unknown typing target: {typing_name!r}") from exc
 
 
+@lru_cache(maxsize=8192, typed=True)
+def _norm_cached(tp: object, _args: object) -> object:
+    """Memoized `TypingNormalize._norm_uncached` keyed by ``(tp, args)``.
+
+    Args:
+      tp: Hashable annotation or runtime type.
+      _args: ``tp.__args__`` (or None); only part of the cache key.
+
+    Returns:
+      The normalized typing object.
+    """
+    return TypingNormalize._norm_uncached(tp)
+
+
+# Function entry point: calling the class goes through type.__call__ and
+# __new__ before reaching _norm; this binds straight to it.
+normalize: Callable[[object], object] = TypingNormalize._norm
+
+
 if __name__ == "__main__":
+    from typing import (
+        AbstractSet,
+        AsyncContextManager,
+        AsyncIterable,
+        AsyncIterator,
+        Awaitable,
+        ByteString,
+        ChainMap,
+        Collection,
+        Container,
+        Coroutine,
+        Counter,
+        DefaultDict,
+        Deque,
+        Generator,
+        Hashable,
+        Iterable,
+        Iterator,
+        Mapping,
+        Match,
+        MutableMapping,
+        MutableSequence,
+        Optional,
+        OrderedDict,
+        Pattern,
+        Reversible,
+        Sequence,
+        Sized,
+        Type,
+    )
 
     def show(title: str,
              input_tp: object,
@@ -618,457 +869,11 @@ if __name__ == "__main__":
         print(f"{'':61s} exp: {exp_str}")
         print(f"{'':61s} valid: {out_str == exp_str}\n")
 
-    # ---------------------- TypeVar cases -----------------------
     T: TypeVar = TypeVar("T", str, bytes)
     U: TypeVar = TypeVar("U", bound=BaseException)
     V: TypeVar = TypeVar("V")
-
-    show("TypeVar constraints -> Union", T, "typing.Union[str, bytes]")
-    show("TypeVar bound -> bound type", U, "<class 'BaseException'>")
-    show("Unconstrained TypeVar -> Any", V, "typing.Any")
-
-    # ---------------------- ParamSpec / Concatenate -------------
     P: ParamSpec = ParamSpec("P")
-    show(
-        "Callable[ParamSpec, R] -> Callable[..., R]",
-        Callable[P, int],  # type: ignore[reportGeneralTypeIssues]
-        "typing.Callable[..., int]",
-    )
-    show(
-        "Callable[Concatenate[..., P], R] -> Callable[..., R]",
-        Callable[
-            Concatenate[int, P],  # type: ignore[reportGeneralTypeIssues] str
-        ],
-        "typing.Callable[..., str]",
-    )
-
-    # ---------------------- Optional / '|' unions ----------------
-    show("Optional[T] stays Optional[T]", Optional[int],
-         "typing.Optional[int]")
-    show(
-        "PEP 604 unions flattened; None first",
-        int | str | None,
-        "typing.Union[NoneType, int, str]",
-    )
-    show(
-        "Nested unions flatten",
-        Union[Union[int, str], Union[str, bytes]],
-        "typing.Union[int, str, bytes]",
-    )
-    show("Union with Any collapses to Any", Union[int, Any], "typing.Any")
-    show("Any in PEP 604 union collapses to Any", int | Any, "typing.Any")
-    show("Optional[Any] collapses to Any", Optional[Any], "typing.Any")
-    show("None|Any collapses to Any", None | Any, "typing.Any")
-
-    # ---------------------- Builtins (PEP 585) -------------------
-    show(
-        "PEP 585 list[...] -> typing.List[...]",
-        list[int | str],
-        "typing.List[typing.Union[int, str]]",
-    )
-    show(
-        "PEP 585 dict[...] -> typing.Dict[...]",
-        dict[str, bytes],
-        "typing.Dict[str, bytes]",
-    )
-    show("PEP 585 set[...] -> typing.Set[...]", set[bytes],
-         "typing.Set[bytes]")
-    show(
-        "PEP 585 frozenset[...] -> typing.FrozenSet[...]",
-        frozenset[int],
-        "typing.FrozenSet[int]",
-    )
-    show(
-        "PEP 585 tuple[T, U] -> typing.Tuple[T, U]",
-        tuple[int, str],
-        "typing.Tuple[int, str]",
-    )
-    show(
-        "PEP 585 tuple[T, ...] -> typing.Tuple[T, ...]",
-        tuple[int, ...],
-        "typing.Tuple[int, ...]",
-    )
-    show("PEP 585 type[T] -> typing.Type[T]", type[int], "typing.Type[int]")
-    show(
-        "typing.Callable[...] remains typing.Callable[...]",
-        Callable[[int, str], bytes],
-        "typing.Callable[[int, str], bytes]",
-    )
-
-    # Bare builtins -> typing with Any defaults
-    show("Bare list -> typing.List[Any]", list, "typing.List[typing.Any]")
-    show(
-        "Bare dict -> typing.Dict[Any, Any]",
-        dict,
-        "typing.Dict[typing.Any, typing.Any]",
-    )
-    show(
-        "Bare tuple -> typing.Tuple[Any, ...]",
-        tuple,
-        "typing.Tuple[typing.Any, ...]",
-    )
-    show("Bare type -> typing.Type[Any]", type, "typing.Type[typing.Any]")
-    show(
-        "Bare callable -> typing.Callable[..., Any]",
-        callable,
-        "typing.Callable[..., typing.Any]",
-    )
-
-    # ---------------------- collections concrete -----------------
-    show(
-        "collections.deque[T] -> typing.Deque[T]",
-        CollDeque[int],
-        "typing.Deque[int]",
-    )
-    show(
-        "collections.defaultdict[K,V] -> typing.DefaultDict[K,V]",
-        CollDefaultDict[str, int],
-        "typing.DefaultDict[str, int]",
-    )
-    show(
-        "collections.OrderedDict[K,V] -> typing.OrderedDict[K,V]",
-        CollOrderedDict[str, int],
-        "typing.OrderedDict[str, int]",
-    )
-    show(
-        "collections.Counter[T] -> typing.Counter[T]",
-        CollCounter[int],
-        "typing.Counter[int]",
-    )
-    show(
-        "collections.ChainMap[K,V] -> typing.ChainMap[K,V]",
-        CollChainMap[str, int],
-        "typing.ChainMap[str, int]",
-    )
-
-    # Bare concrete -> defaults
-    show(
-        "Bare collections.deque -> typing.Deque[Any]",
-        CollDeque,
-        "typing.Deque[typing.Any]",
-    )
-    show(
-        "Bare collections.defaultdict -> typing.DefaultDict[Any, Any]",
-        CollDefaultDict,
-        "typing.DefaultDict[typing.Any, typing.Any]",
-    )
-    show(
-        "Bare collections.OrderedDict -> typing.OrderedDict[Any, Any]",
-        CollOrderedDict,
-        "typing.OrderedDict[typing.Any, typing.Any]",
-    )
-    show(
-        "Bare collections.Counter -> typing.Counter[Any]",
-        CollCounter,
-        "typing.Counter[typing.Any]",
-    )
-    show(
-        "Bare collections.ChainMap -> typing.ChainMap[Any, Any]",
-        CollChainMap,
-        "typing.ChainMap[typing.Any, typing.Any]",
-    )
-
-    # ---------------------- collections.abc ----------------------
-    show(
-        "collections.abc Mapping[K,V] -> typing.Mapping[K,V]",
-        AbcMapping[str, int],
-        "typing.Mapping[str, int]",
-    )
-    show(
-        "collections.abc Sequence[T] -> typing.Sequence[T]",
-        AbcSequence[int],
-        "typing.Sequence[int]",
-    )
-    show(
-        "collections.abc Iterable[T] -> typing.Iterable[T]",
-        AbcIterable[int],
-        "typing.Iterable[int]",
-    )
-    show(
-        "collections.abc AsyncIterator[T] -> typing.AsyncIterator[T]",
-        AbcAsyncIterator[int],
-        "typing.AsyncIterator[int]",
-    )
-    show(
-        "collections.abc Generator[T,T,T] -> typing.Generator[T,T,T]",
-        AbcGenerator[int, int, int],
-        "typing.Generator[int, int, int]",
-    )
-
-    # ---------------------- regex runtime ↔ typing ---------------
-    show(
-        "re.Pattern[T] -> typing.Pattern[T]",
-        RePattern[str],
-        "typing.Pattern[str]",
-    )
-    show("re.Match[T] -> typing.Match[T]", ReMatch[str], "typing.Match[str]")
-    show(
-        "Bare re.Pattern -> typing.Pattern[Any]",
-        RePattern,
-        "typing.Pattern[typing.Any]",
-    )
-    show(
-        "Bare re.Match -> typing.Match[Any]",
-        ReMatch,
-        "typing.Match[typing.Any]",
-    )
-
-    # ---------------------- Bare typing generics -----------------
-    show("Bare typing.List -> typing.List[Any]", List,
-         "typing.List[typing.Any]")
-    show(
-        "Bare typing.Dict -> typing.Dict[Any, Any]",
-        Dict,
-        "typing.Dict[typing.Any, typing.Any]",
-    )
-    show("Bare typing.Set -> typing.Set[Any]", Set, "typing.Set[typing.Any]")
-    show(
-        "Bare typing.FrozenSet -> typing.FrozenSet[Any]",
-        FrozenSet,
-        "typing.FrozenSet[typing.Any]",
-    )
-    show(
-        "Bare typing.Tuple -> typing.Tuple[Any, ...]",
-        Tuple,
-        "typing.Tuple[typing.Any, ...]",
-    )
-    show("Bare typing.Type -> typing.Type[Any]", Type,
-         "typing.Type[typing.Any]")
-    show(
-        "Bare typing.Deque -> typing.Deque[Any]",
-        Deque,
-        "typing.Deque[typing.Any]",
-    )
-    show(
-        "Bare typing.DefaultDict -> typing.DefaultDict[Any, Any]",
-        DefaultDict,
-        "typing.DefaultDict[typing.Any, typing.Any]",
-    )
-    show(
-        "Bare typing.OrderedDict -> typing.OrderedDict[Any, Any]",
-        OrderedDict,
-        "typing.OrderedDict[typing.Any, typing.Any]",
-    )
-    show(
-        "Bare typing.Counter -> typing.Counter[Any]",
-        Counter,
-        "typing.Counter[typing.Any]",
-    )
-    show(
-        "Bare typing.ChainMap -> typing.ChainMap[Any, Any]",
-        ChainMap,
-        "typing.ChainMap[typing.Any, typing.Any]",
-    )
-    show(
-        "Bare typing.Mapping -> typing.Mapping[Any, Any]",
-        Mapping,
-        "typing.Mapping[typing.Any, typing.Any]",
-    )
-    show(
-        "Bare typing.MutableMapping -> typing.MutableMapping[Any, Any]",
-        MutableMapping,
-        "typing.MutableMapping[typing.Any, typing.Any]",
-    )
-    show(
-        "Bare typing.Sequence -> typing.Sequence[Any]",
-        Sequence,
-        "typing.Sequence[typing.Any]",
-    )
-    show(
-        "Bare typing.MutableSequence -> typing.MutableSequence[Any]",
-        MutableSequence,
-        "typing.MutableSequence[typing.Any]",
-    )
-    show(
-        "Bare typing.Iterable -> typing.Iterable[Any]",
-        Iterable,
-        "typing.Iterable[typing.Any]",
-    )
-    show(
-        "Bare typing.Iterator -> typing.Iterator[Any]",
-        Iterator,
-        "typing.Iterator[typing.Any]",
-    )
-    show(
-        "Bare typing.Collection -> typing.Collection[Any]",
-        Collection,
-        "typing.Collection[typing.Any]",
-    )
-    show(
-        "Bare typing.AbstractSet -> typing.AbstractSet[Any]",
-        AbstractSet,
-        "typing.AbstractSet[typing.Any]",
-    )
-    show(
-        "Bare typing.ByteString -> typing.ByteString",
-        ByteString,
-        "typing.ByteString",
-    )
-    show(
-        "Bare typing.Reversible -> typing.Reversible[Any]",
-        Reversible,
-        "typing.Reversible[typing.Any]",
-    )
-    show("Bare typing.Sized -> typing.Sized", Sized, "typing.Sized")
-    show(
-        "Bare typing.Container -> typing.Container",
-        Container,
-        "typing.Container",
-    )
-    show("Bare typing.Hashable -> typing.Hashable", Hashable,
-         "typing.Hashable")
-    show(
-        "Bare typing.Awaitable -> typing.Awaitable",
-        Awaitable,
-        "typing.Awaitable",
-    )
-    show(
-        "Bare typing.Coroutine -> typing.Coroutine[Any, Any, Any]",
-        Coroutine,
-        "typing.Coroutine[typing.Any, typing.Any, typing.Any]",
-    )
-    show(
-        "Bare typing.AsyncIterable -> typing.AsyncIterable[Any]",
-        AsyncIterable,
-        "typing.AsyncIterable[typing.Any]",
-    )
-    show(
-        "Bare typing.AsyncIterator -> typing.AsyncIterator[Any]",
-        AsyncIterator,
-        "typing.AsyncIterator[typing.Any]",
-    )
-    show(
-        "Bare typing.Generator -> typing.Generator[Any, Any, Any]",
-        Generator,
-        "typing.Generator[typing.Any, typing.Any, typing.Any]",
-    )
-    show(
-        "Bare typing.AsyncContextManager gets defaults",
-        AsyncContextManager,
-        "typing.AsyncContextManager[typing.Any, bool | None]",
-    )
-    show(
-        "Bare typing.Pattern -> typing.Pattern[Any]",
-        Pattern,
-        "typing.Pattern[typing.Any]",
-    )
-    show(
-        "Bare typing.Match -> typing.Match[Any]",
-        Match,
-        "typing.Match[typing.Any]",
-    )
-    show(
-        "Bare typing.Callable -> typing.Callable[..., Any]",
-        Callable,
-        "typing.Callable[..., typing.Any]",
-    )
-    show("Bare typing.Union -> typing.Any", Union, "typing.Any")
-
-    # ---------------------- Nested generics ----------------------
-    show(
-        "Nested generics + unions normalize (Dict[...] example)",
-        dict[str | None, list[Optional[int | bytes]]],
-        ("typing.Dict[typing.Optional[str],"
-         "typing.List[typing.Union[NoneType, int, bytes]]]"),
-    )
-    show(
-        "Nested generics normalize (List[Dict[...]] example)",
-        List[Dict[str, List[int | str]]],
-        "typing.List[typing.Dict[str, typing.List[int | str]]]",
-    )
 
-    # ---------------------- Callable specifics -------------------
-    show(
-        "Callable with nested generics normalizes recursively",
-        Callable[[list[int | str], Optional[bytes]], Optional[str]],
-        ("typing.Callable[[typing.List[typing.Union[int, str]], "
-         "typing.Optional[bytes]], typing.Optional[str]]"),
-    )
-
-    # ---------------------- String-based Type annotations --------
-    show(
-        "Type['int'] -> typing.Type[int]",
-        Type["int"],
-        "typing.Type[int]",
-    )
-    show(
-        "Type['str'] -> typing.Type[str]",
-        Type["str"],
-        "typing.Type[str]",
-    )
-    show(
-        "Type['list'] -> typing.Type[list]",
-        Type["list"],
-        "typing.Type[list]",
-    )
-    show(
-        "Type['dict'] -> typing.Type[dict]",
-        Type["dict"],
-        "typing.Type[dict]",
-    )
-    show(
-        "Type['None'] -> typing.Type[NoneType]",
-        Type["None"],
-        "typing.Type[NoneType]",
-    )
-    show(
-        "Type['NoneType'] -> typing.Type[NoneType]",
-        Type["NoneType"],  # type: ignore[reportUndefinedVariable]
-        "typing.Type[NoneType]",
-    )
-    show(
-        "Type['object'] -> typing.Type[object]",
-        Type["object"],
-        "typing.Type[object]",
-    )
-    show(
-        "Type['complex'] -> typing.Type[complex]",
-        Type["complex"],
-        "typing.Type[complex]",
-    )
-    show(
-        "Type['bool'] -> typing.Type[bool]",
-        Type["bool"],
-        "typing.Type[bool]",
-    )
-    show(
-        "Type['float'] -> typing.Type[float]",
-        Type["float"],
-        "typing.Type[float]",
-    )
-    show(
-        "Type['bytes'] -> typing.Type[bytes]",
-        Type["bytes"],
-        "typing.Type[bytes]",
-    )
-    show(
-        "Type['set'] -> typing.Type[set]",
-        Type["set"],
-        "typing.Type[set]",
-    )
-    show(
-        "Type['frozenset'] -> typing.Type[frozenset]",
-        Type["frozenset"],
-        "typing.Type[frozenset]",
-    )
-    show(
-        "Type['tuple'] -> typing.Type[tuple]",
-        Type["tuple"],
-        "typing.Type[tuple]",
-    )
-    show(
-        "Type['unknown_type'] -> typing.Type[Any]",
-        Type["unknown_type"],  # type: ignore[reportUndefinedVariable]
-        "typing.Type[typing.Any]",
-    )
-
-    show(
-        "Nested Type with string args normalizes recursively",
-        List[Type["int"]],
-        "typing.List[typing.Type[int]]",
-    )
-
-    # ---------------------- Custom class preservation -------------
     # Define some custom classes for testing
     class CustomClass:
         pass
@@ -1076,43 +881,498 @@ if __name__ == "__main__":
     class AnotherClass:
         pass
 
-    show(
-        "Type[custom_class] preserves actual class objects",
-        Type[CustomClass],
-        "typing.Type[__main__.CustomClass]",
-    )
-    show(
-        "Type[AnotherClass] preserves actual class objects",
-        Type[AnotherClass],
-        "typing.Type[__main__.AnotherClass]",
-    )
-    show(
-        "Union[custom_class, int] preserves actual class objects",
-        Union[CustomClass, int],
-        "typing.Union[__main__.CustomClass, int]",
-    )
-    show(
-        "Union[int, custom_class] preserves actual class objects",
-        Union[int, AnotherClass],
-        "typing.Union[int, __main__.AnotherClass]",
-    )
-    show(
-        "List[Type[custom_class]] preserves actual class objects",
-        List[Type[CustomClass]],
-        "typing.List[typing.Type[__main__.CustomClass]]",
-    )
-    show(
-        "Dict[str, Type[custom_class]] preserves actual class objects",
-        Dict[str, Type[CustomClass]],
-        "typing.Dict[str, typing.Type[__main__.CustomClass]]",
-    )
-    show(
-        "Union[Type[custom_class], Type[str]] mixed case",
-        Union[Type[CustomClass], Type["str"]],
-        "typing.Union[typing.Type[__main__.CustomClass], typing.Type[str]]",
-    )
-    show(
-        "Callable[[Type[custom_class]], int] preserves actual class objects",
-        Callable[[Type[CustomClass]], int],
-        "typing.Callable[[typing.Type[__main__.CustomClass]], int]",
-    )
+    # (title, input annotation, expected repr) for each demo case
+    _CASES: Tuple[Tuple[str, object, str], ...] = (
+        # ---------------------- TypeVar cases -----------------------
+        ("TypeVar constraints -> Union", T, "typing.Union[str, bytes]"),
+        ("TypeVar bound -> bound type", U, "<class 'BaseException'>"),
+        ("Unconstrained TypeVar -> Any", V, "typing.Any"),
+
+        # ---------------------- ParamSpec / Concatenate -------------
+        (
+            "Callable[ParamSpec, R] -> Callable[..., R]",
+            Callable[P, int],  # type: ignore[reportGeneralTypeIssues]
+            "typing.Callable[..., int]",
+        ),
+        (
+            "Callable[Concatenate[..., P], R] -> Callable[..., R]",
+            Callable[Concatenate[int, P],  # type: ignore[reportGeneralTypeIssues]
+                     str],
+            "typing.Callable[..., str]",
+        ),
+
+        # ---------------------- Optional / '|' unions ----------------
+        (
+            "Optional[T] stays Optional[T]",
+            Optional[int],
+            "typing.Optional[int]",
+        ),
+        (
+            "PEP 604 unions flattened; None first",
+            int | str | None,
+            "typing.Union[NoneType, int, str]",
+        ),
+        (
+            "Nested unions flatten",
+            Union[Union[int, str], Union[str, bytes]],
+            "typing.Union[int, str, bytes]",
+        ),
+        ("Union with Any collapses to Any", Union[int, Any], "typing.Any"),
+        ("Any in PEP 604 union collapses to Any", int | Any, "typing.Any"),
+        ("Optional[Any] collapses to Any", Optional[Any], "typing.Any"),
+        ("None|Any collapses to Any", None | Any, "typing.Any"),
+
+        # ---------------------- Builtins (PEP 585) -------------------
+        (
+            "PEP 585 list[...] -> typing.List[...]",
+            list[int | str],
+            "typing.List[typing.Union[int, str]]",
+        ),
+        (
+            "PEP 585 dict[...] -> typing.Dict[...]",
+            dict[str, bytes],
+            "typing.Dict[str, bytes]",
+        ),
+        (
+            "PEP 585 set[...] -> typing.Set[...]",
+            set[bytes],
+            "typing.Set[bytes]",
+        ),
+        (
+            "PEP 585 frozenset[...] -> typing.FrozenSet[...]",
+            frozenset[int],
+            "typing.FrozenSet[int]",
+        ),
+        (
+            "PEP 585 tuple[T, U] -> typing.Tuple[T, U]",
+            tuple[int, str],
+            "typing.Tuple[int, str]",
+        ),
+        (
+            "PEP 585 tuple[T, ...] -> typing.Tuple[T, ...]",
+            tuple[int, ...],
+            "typing.Tuple[int, ...]",
+        ),
+        ("PEP 585 type[T] -> typing.Type[T]", type[int], "typing.Type[int]"),
+        (
+            "typing.Callable[...] remains typing.Callable[...]",
+            Callable[[int, str], bytes],
+            "typing.Callable[[int, str], bytes]",
+        ),
+
+        # Bare builtins -> typing with Any defaults
+        ("Bare list -> typing.List[Any]", list, "typing.List[typing.Any]"),
+        (
+            "Bare dict -> typing.Dict[Any, Any]",
+            dict,
+            "typing.Dict[typing.Any, typing.Any]",
+        ),
+        (
+            "Bare tuple -> typing.Tuple[Any, ...]",
+            tuple,
+            "typing.Tuple[typing.Any, ...]",
+        ),
+        ("Bare type -> typing.Type[Any]", type, "typing.Type[typing.Any]"),
+        (
+            "Bare callable -> typing.Callable[..., Any]",
+            callable,
+            "typing.Callable[..., typing.Any]",
+        ),
+
+        # ---------------------- collections concrete -----------------
+        (
+            "collections.deque[T] -> typing.Deque[T]",
+            CollDeque[int],
+            "typing.Deque[int]",
+        ),
+        (
+            "collections.defaultdict[K,V] -> typing.DefaultDict[K,V]",
+            CollDefaultDict[str, int],
+            "typing.DefaultDict[str, int]",
+        ),
+        (
+            "collections.OrderedDict[K,V] -> typing.OrderedDict[K,V]",
+            CollOrderedDict[str, int],
+            "typing.OrderedDict[str, int]",
+        ),
+        (
+            "collections.Counter[T] -> typing.Counter[T]",
+            CollCounter[int],
+            "typing.Counter[int]",
+        ),
+        (
+            "collections.ChainMap[K,V] -> typing.ChainMap[K,V]",
+            CollChainMap[str, int],
+            "typing.ChainMap[str, int]",
+        ),
+
+        # Bare concrete -> defaults
+        (
+            "Bare collections.deque -> typing.Deque[Any]",
+            CollDeque,
+            "typing.Deque[typing.Any]",
+        ),
+        (
+            "Bare collections.defaultdict -> typing.DefaultDict[Any, Any]",
+            CollDefaultDict,
+            "typing.DefaultDict[typing.Any, typing.Any]",
+        ),
+        (
+            "Bare collections.OrderedDict -> typing.OrderedDict[Any, Any]",
+            CollOrderedDict,
+            "typing.OrderedDict[typing.Any, typing.Any]",
+        ),
+        (
+            "Bare collections.Counter -> typing.Counter[Any]",
+            CollCounter,
+            "typing.Counter[typing.Any]",
+        ),
+        (
+            "Bare collections.ChainMap -> typing.ChainMap[Any, Any]",
+            CollChainMap,
+            "typing.ChainMap[typing.Any, typing.Any]",
+        ),
+
+        # ---------------------- collections.abc ----------------------
+        (
+            "collections.abc Mapping[K,V] -> typing.Mapping[K,V]",
+            AbcMapping[str, int],
+            "typing.Mapping[str, int]",
+        ),
+        (
+            "collections.abc Sequence[T] -> typing.Sequence[T]",
+            AbcSequence[int],
+            "typing.Sequence[int]",
+        ),
+        (
+            "collections.abc Iterable[T] -> typing.Iterable[T]",
+            AbcIterable[int],
+            "typing.Iterable[int]",
+        ),
+        (
+            "collections.abc AsyncIterator[T] -> typing.AsyncIterator[T]",
+            AbcAsyncIterator[int],
+            "typing.AsyncIterator[int]",
+        ),
+        (
+            "collections.abc Generator[T,T,T] -> typing.Generator[T,T,T]",
+            AbcGenerator[int, int, int],
+            "typing.Generator[int, int, int]",
+        ),
+
+        # ---------------------- regex runtime ↔ typing ---------------
+        (
+            "re.Pattern[T] -> typing.Pattern[T]",
+            RePattern[str],
+            "typing.Pattern[str]",
+        ),
+        ("re.Match[T] -> typing.Match[T]", ReMatch[str], "typing.Match[str]"),
+        (
+            "Bare re.Pattern -> typing.Pattern[Any]",
+            RePattern,
+            "typing.Pattern[typing.Any]",
+        ),
+        (
+            "Bare re.Match -> typing.Match[Any]",
+            ReMatch,
+            "typing.Match[typing.Any]",
+        ),
+
+        # ---------------------- Bare typing generics -----------------
+        (
+            "Bare typing.List -> typing.List[Any]",
+            List,
+            "typing.List[typing.Any]",
+        ),
+        (
+            "Bare typing.Dict -> typing.Dict[Any, Any]",
+            Dict,
+            "typing.Dict[typing.Any, typing.Any]",
+        ),
+        ("Bare typing.Set -> typing.Set[Any]", Set, "typing.Set[typing.Any]"),
+        (
+            "Bare typing.FrozenSet -> typing.FrozenSet[Any]",
+            FrozenSet,
+            "typing.FrozenSet[typing.Any]",
+        ),
+        (
+            "Bare typing.Tuple -> typing.Tuple[Any, ...]",
+            Tuple,
+            "typing.Tuple[typing.Any, ...]",
+        ),
+        (
+            "Bare typing.Type -> typing.Type[Any]",
+            Type,
+            "typing.Type[typing.Any]",
+        ),
+        (
+            "Bare typing.Deque -> typing.Deque[Any]",
+            Deque,
+            "typing.Deque[typing.Any]",
+        ),
+        (
+            "Bare typing.DefaultDict -> typing.DefaultDict[Any, Any]",
+            DefaultDict,
+            "typing.DefaultDict[typing.Any, typing.Any]",
+        ),
+        (
+            "Bare typing.OrderedDict -> typing.OrderedDict[Any, Any]",
+            OrderedDict,
+            "typing.OrderedDict[typing.Any, typing.Any]",
+        ),
+        (
+            "Bare typing.Counter -> typing.Counter[Any]",
+            Counter,
+            "typing.Counter[typing.Any]",
+        ),
+        (
+            "Bare typing.ChainMap -> typing.ChainMap[Any, Any]",
+            ChainMap,
+            "typing.ChainMap[typing.Any, typing.Any]",
+        ),
+        (
+            "Bare typing.Mapping -> typing.Mapping[Any, Any]",
+            Mapping,
+            "typing.Mapping[typing.Any, typing.Any]",
+        ),
+        (
+            "Bare typing.MutableMapping -> typing.MutableMapping[Any, Any]",
+            MutableMapping,
+            "typing.MutableMapping[typing.Any, typing.Any]",
+        ),
+        (
+            "Bare typing.Sequence -> typing.Sequence[Any]",
+            Sequence,
+            "typing.Sequence[typing.Any]",
+        ),
+        (
+            "Bare typing.MutableSequence -> typing.MutableSequence[Any]",
+            MutableSequence,
+            "typing.MutableSequence[typing.Any]",
+        ),
+        (
+            "Bare typing.Iterable -> typing.Iterable[Any]",
+            Iterable,
+            "typing.Iterable[typing.Any]",
+        ),
+        (
+            "Bare typing.Iterator -> typing.Iterator[Any]",
+            Iterator,
+            "typing.Iterator[typing.Any]",
+        ),
+        (
+            "Bare typing.Collection -> typing.Collection[Any]",
+            Collection,
+            "typing.Collection[typing.Any]",
+        ),
+        (
+            "Bare typing.AbstractSet -> typing.AbstractSet[Any]",
+            AbstractSet,
+            "typing.AbstractSet[typing.Any]",
+        ),
+        (
+            "Bare typing.ByteString -> typing.ByteString",
+            ByteString,
+            "typing.ByteString",
+        ),
+        (
+            "Bare typing.Reversible -> typing.Reversible[Any]",
+            Reversible,
+            "typing.Reversible[typing.Any]",
+        ),
+        ("Bare typing.Sized -> typing.Sized", Sized, "typing.Sized"),
+        (
+            "Bare typing.Container -> typing.Container",
+            Container,
+            "typing.Container",
+        ),
+        (
+            "Bare typing.Hashable -> typing.Hashable",
+            Hashable,
+            "typing.Hashable",
+        ),
+        (
+            "Bare typing.Awaitable -> typing.Awaitable",
+            Awaitable,
+            "typing.Awaitable",
+        ),
+        (
+            "Bare typing.Coroutine -> typing.Coroutine[Any, Any, Any]",
+            Coroutine,
+            "typing.Coroutine[typing.Any, typing.Any, typing.Any]",
+        ),
+        (
+            "Bare typing.AsyncIterable -> typing.AsyncIterable[Any]",
+            AsyncIterable,
+            "typing.AsyncIterable[typing.Any]",
+        ),
+        (
+            "Bare typing.AsyncIterator -> typing.AsyncIterator[Any]",
+            AsyncIterator,
+            "typing.AsyncIterator[typing.Any]",
+        ),
+        (
+            "Bare typing.Generator -> typing.Generator[Any, Any, Any]",
+            Generator,
+            "typing.Generator[typing.Any, typing.Any, typing.Any]",
+        ),
+        (
+            "Bare typing.AsyncContextManager gets defaults",
+            AsyncContextManager,
+            # Python 3.13+ adds a defaulted second parameter to the repr.
+            repr(AsyncContextManager[Any]),
+        ),
+        (
+            "Bare typing.Pattern -> typing.Pattern[Any]",
+            Pattern,
+            "typing.Pattern[typing.Any]",
+        ),
+        (
+            "Bare typing.Match -> typing.Match[Any]",
+            Match,
+            "typing.Match[typing.Any]",
+        ),
+        (
+            "Bare typing.Callable -> typing.Callable[..., Any]",
+            Callable,
+            "typing.Callable[..., typing.Any]",
+        ),
+        ("Bare typing.Union -> typing.Any", Union, "typing.Any"),
+
+        # ---------------------- Nested generics ----------------------
+        (
+            "Nested generics + unions normalize (Dict[...] example)",
+            dict[str | None, list[Optional[int | bytes]]],
+            "typing.Dict[typing.Optional[str], "
+            "typing.List[typing.Union[NoneType, int, bytes]]]",
+        ),
+        (
+            "Nested generics normalize (List[Dict[...]] example)",
+            List[Dict[str, List[int | str]]],
+            "typing.List[typing.Dict[str, typing.List[int | str]]]",
+        ),
+
+        # ---------------------- Callable specifics -------------------
+        (
+            "Callable with nested generics normalizes recursively",
+            Callable[[list[int | str], Optional[bytes]], Optional[str]],
+            "typing.Callable[[typing.List[typing.Union[int, str]], "
+             "typing.Optional[bytes]], typing.Optional[str]]",
+        ),
+
+        # ---------------------- String-based Type annotations --------
+        ("Type['int'] -> typing.Type[int]", Type["int"], "typing.Type[int]"),
+        ("Type['str'] -> typing.Type[str]", Type["str"], "typing.Type[str]"),
+        (
+            "Type['list'] -> typing.Type[list]",
+            Type["list"],
+            "typing.Type[list]",
+        ),
+        (
+            "Type['dict'] -> typing.Type[dict]",
+            Type["dict"],
+            "typing.Type[dict]",
+        ),
+        (
+            "Type['None'] -> typing.Type[NoneType]",
+            Type["None"],
+            "typing.Type[NoneType]",
+        ),
+        (
+            "Type['NoneType'] -> typing.Type[NoneType]",
+            Type["NoneType"],  # type: ignore[reportUndefinedVariable]
+            "typing.Type[NoneType]",
+        ),
+        (
+            "Type['object'] -> typing.Type[object]",
+            Type["object"],
+            "typing.Type[object]",
+        ),
+        (
+            "Type['complex'] -> typing.Type[complex]",
+            Type["complex"],
+            "typing.Type[complex]",
+        ),
+        (
+            "Type['bool'] -> typing.Type[bool]",
+            Type["bool"],
+            "typing.Type[bool]",
+        ),
+        (
+            "Type['float'] -> typing.Type[float]",
+            Type["float"],
+            "typing.Type[float]",
+        ),
+        (
+            "Type['bytes'] -> typing.Type[bytes]",
+            Type["bytes"],
+            "typing.Type[bytes]",
+        ),
+        ("Type['set'] -> typing.Type[set]", Type["set"], "typing.Type[set]"),
+        (
+            "Type['frozenset'] -> typing.Type[frozenset]",
+            Type["frozenset"],
+            "typing.Type[frozenset]",
+        ),
+        (
+            "Type['tuple'] -> typing.Type[tuple]",
+            Type["tuple"],
+            "typing.Type[tuple]",
+        ),
+        (
+            "Type['unknown_type'] -> typing.Type[Any]",
+            Type["unknown_type"],  # type: ignore[reportUndefinedVariable]
+            "typing.Type[typing.Any]",
+        ),
+        (
+            "Nested Type with string args normalizes recursively",
+            List[Type["int"]],
+            "typing.List[typing.Type[int]]",
+        ),
+
+        # ---------------------- Custom class preservation -------------
+        (
+            "Type[custom_class] preserves actual class objects",
+            Type[CustomClass],
+            "typing.Type[__main__.CustomClass]",
+        ),
+        (
+            "Type[AnotherClass] preserves actual class objects",
+            Type[AnotherClass],
+            "typing.Type[__main__.AnotherClass]",
+        ),
+        (
+            "Union[custom_class, int] preserves actual class objects",
+            Union[CustomClass, int],
+            "typing.Union[__main__.CustomClass, int]",
+        ),
+        (
+            "Union[int, custom_class] preserves actual class objects",
+            Union[int, AnotherClass],
+            "typing.Union[int, __main__.AnotherClass]",
+        ),
+        (
+            "List[Type[custom_class]] preserves actual class objects",
+            List[Type[CustomClass]],
+            "typing.List[typing.Type[__main__.CustomClass]]",
+        ),
+        (
+            "Dict[str, Type[custom_class]] preserves actual class objects",
+            Dict[str, Type[CustomClass]],
+            "typing.Dict[str, typing.Type[__main__.CustomClass]]",
+        ),
+        (
+            "Union[Type[custom_class], Type[str]] mixed case",
+            Union[Type[CustomClass], Type["str"]],
+            ("typing.Union[typing.Type[__main__.CustomClass], "
+             "typing.Type[str]]"),
+        ),
+        (
+            ("Callable[[Type[custom_class]], int] preserves actual class "
+             "objects"),
+            Callable[[Type[CustomClass]], int],
+            "typing.Callable[[typing.Type[__main__.CustomClass]], int]",
+        ),
+    )
+    for title, input_tp, expected in _CASES:
+        show(title, input_tp, expected)
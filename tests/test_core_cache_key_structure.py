@@ -1,3 +1,6 @@
+from sys import modules
+from typing import Any
+
 from wizedispatcher import dispatch
 
 
@@ -19,3 +22,20 @@ def test_cache_key_includes_structure() -> None:
     assert f(1, 2, 3) == "int"  # type: ignore[reportCallIssue]
     assert f(1, x=1) == "int"  # type: ignore[reportCallIssue]
     assert f(1, y=1) == "int"  # type: ignore[reportCallIssue]
+
+
+def test_cache_key_uses_precomputed_variadic_names() -> None:
+    """Variadic names come from the registry; keys differ per shape."""
+    reg: Any = modules[__name__].__fdispatch_registry__["f"]
+    assert (reg._varpos_name, reg._varkw_name) == ("args", "kwargs")
+    reg._cache.clear()
+    f(1, 2, y=1)
+    f(1, 2, y=2)
+    f(1, 2, 3, y=1)
+    f(1, x=1, y=1)
+    f(1, y=1, x=1)
+    assert set(reg._cache) == {
+        (int, (tuple, 1), (dict, frozenset({"y"}))),
+        (int, (tuple, 2), (dict, frozenset({"y"}))),
+        (int, (tuple, 0), (dict, frozenset({"x", "y"}))),
+    }
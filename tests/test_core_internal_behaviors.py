@@ -1,9 +1,11 @@
 # Behavior-oriented tests for internal core behaviors without referencing
 # line numbers
+from contextlib import suppress
+from threading import Thread
 from typing import Any, Callable, Dict, List
 
-from wizedispatcher import WizeDispatcher
-from wizedispatcher.core import TypeMatch
+from wizedispatcher import WILDCARD, WizeDispatcher
+from wizedispatcher.core import TypeMatch, _hint_parts, _signature
 
 
 def test_type_match_rejects_non_mapping_for_dict_annotations() -> None:
@@ -84,3 +86,165 @@ def test_function_registry_initialization_on_first_register() -> None:
     )
     # If it didn't raise, initialization path worked
     assert callable(new_fn)
+
+
+def test_extract_func_unwraps_exact_method_wrappers_only() -> None:
+    """_extract_func unwraps classmethod/staticmethod but not subclasses."""
+
+    def fn() -> None:
+        return None
+
+    class MyStatic(staticmethod):
+        pass
+
+    assert WizeDispatcher._extract_func(classmethod(fn)) is fn
+    assert WizeDispatcher._extract_func(staticmethod(fn)) is fn
+    assert WizeDispatcher._extract_func(fn) is fn
+    wrapped: MyStatic = MyStatic(fn)
+    assert WizeDispatcher._extract_func(wrapped) is wrapped
+
+
+def test_pending_descriptors_are_per_thread() -> None:
+    """Pending class-body descriptors are not shared across threads."""
+    seen: Dict[str, Any] = {}
+
+    def worker() -> None:
+        pending: Dict[str, Any] = WizeDispatcher._pending()
+        pending["ThreadOwner"] = object()
+        seen["same"] = WizeDispatcher._pending() is pending
+
+    th: Thread = Thread(target=worker)
+    th.start()
+    th.join()
+    assert seen["same"] is True
+    assert "ThreadOwner" not in WizeDispatcher._pending()
+
+
+def test_merge_types_precedence_and_none_values() -> None:
+    """Decorator > function > fallback > WILDCARD, None kept as a value."""
+    merged: Dict[str, Any] = WizeDispatcher._merge_types(
+        order=("a", "b", "c", "d"),
+        decorator_types={"a": None},
+        fn_ann={"a": int, "b": str},
+        fallback_ann={"b": bytes, "c": float},
+    )
+    assert merged == {"a": None, "b": str, "c": float, "d": WILDCARD}
+    assert WizeDispatcher._merge_types(order=("x", ),
+                                       decorator_types={},
+                                       fn_ann={}) == {
+                                           "x": WILDCARD
+                                       }
+
+
+def test_is_match_memoizes_hint_decomposition() -> None:
+    """Hashable hints are resolved once; unhashable ones still match."""
+    _hint_parts.cache_clear()
+    for _ in range(3):
+        assert TypeMatch._is_match({"a": 1}, Dict[str, int]) is True
+        assert TypeMatch._is_match({"a": "x"}, Dict[str, int]) is False
+    info: Any = _hint_parts.cache_info()
+    assert info.misses == 3 and info.hits > 0
+    assert _hint_parts("int") == (int, None, ())
+    assert TypeMatch._is_match(len, [Any]) is False
+    assert TypeMatch._is_match(len, Callable[[List[int]], int]) is True
+
+
+def test_call_with_globals_restores_on_error_and_skips_empty() -> None:
+    """Injected names are undone even on error; empty injection is a call."""
+    call: Any = WizeDispatcher._BaseRegistry._call_with_globals
+
+    def reads_global(a: int) -> Any:
+        if a < 0:
+            raise ValueError(a)
+        return (a, injected_name)  # type: ignore[name-defined] # noqa: F821
+
+    gns: Dict[str, Any] = reads_global.__globals__
+    before: Dict[str, Any] = dict(gns)
+    assert call(reads_global, [1], {}, {"injected_name": "x"}) == (1, "x")
+    with suppress(ValueError):
+        call(reads_global, [-1], {}, {"injected_name": "y"})
+    assert gns == before
+    try:
+        call(reads_global, [2], {}, {})
+    except NameError:
+        pass
+    else:
+        raise AssertionError("nothing should have been injected")
+
+
+def test_signature_cache_is_per_function_object() -> None:
+    """Signatures are reused per function, not shared across closures."""
+
+    def make(default: int) -> Callable[..., int]:
+
+        def inner(x: int = default) -> int:
+            return x
+
+        return inner
+
+    first: Callable[..., int] = make(1)
+    second: Callable[..., int] = make(2)
+    assert _signature(first) is _signature(first)
+    assert _signature(first).parameters["x"].default == 1
+    assert _signature(second).parameters["x"].default == 2
+    assert str(_signature(len)) == "(obj, /)"
+
+
+def test_make_binder_matches_signature_bind() -> None:
+    """Compiled binders agree with Signature.bind + apply_defaults."""
+    from inspect import signature
+
+    sentinel: object = object()
+
+    def target(a, b=sentinel, /, c=2, *rest, d, e=[], **kw):  # noqa: B006
+        return (a, b, c, rest, d, e, kw)
+
+    sig: Any = signature(target)
+    binder: Callable[..., Dict[str, Any]] = WizeDispatcher._make_binder(
+        sig=sig, name="target")
+    calls: List[Any] = [
+        ((1, ), {"d": 4}),
+        ((1, 2, 3, 4, 5), {"d": 4, "x": 6}),
+        ((1, ), {"c": 3, "d": 4, "e": 5}),
+    ]
+    for args, kwargs in calls:
+        expected: Any = sig.bind(*args, **kwargs)
+        expected.apply_defaults()
+        got: Dict[str, Any] = binder(*args, **kwargs)
+        assert list(got.items()) == list(expected.arguments.items())
+    assert binder(1, d=0)["b"] is sentinel
+    assert binder(1, a=5, d=0)["kw"] == {"a": 5}
+    for bad_args, bad_kwargs in (((), {"d": 1}), ((1, ), {}),
+                                 ((1, 2, 3), {"c": 1, "d": 1})):
+        try:
+            binder(*bad_args, **bad_kwargs)
+        except TypeError:
+            pass
+        else:
+            raise AssertionError("binder accepted an invalid call")
+    assert WizeDispatcher._make_binder(sig=signature(lambda: 0),
+                                       name="<lambda>")() == {}
+
+    def one(x):  # type: ignore[no-untyped-def]
+        return x
+
+    # Keyword target names cannot name the generated function.
+    assert WizeDispatcher._make_binder(sig=signature(one),
+                                       name="class")(1) == {"x": 1}
+
+
+def test_registry_records_use_slots() -> None:
+    """Registries, overload records and descriptors carry no __dict__."""
+
+    def target(a: int) -> int:
+        return a
+
+    reg: Any = WizeDispatcher._FunctionRegistry(target_name="target",
+                                                original=target)
+    reg.register(func=target,
+                 type_map={"a": int},
+                 dec_keys=frozenset(),
+                 is_original=True)
+    for obj in (reg, reg._overloads[0],
+                WizeDispatcher._OverloadDescriptor()):
+        assert not hasattr(obj, "__dict__")
@@ -0,0 +1,105 @@
+from sys import modules
+from typing import (
+    Annotated,
+    Any,
+    Callable,
+    List,
+    Literal,
+    Optional,
+    Protocol,
+    Tuple,
+    TypedDict,
+    runtime_checkable,
+)
+
+from wizedispatcher import TypeMatch, dispatch
+
+
+def items(x: object) -> str:
+    """Fallback for values that are not a list of ints."""
+    _ = x
+    return "fallback"
+
+
+@dispatch.items(x=List[int])
+def _(x) -> str:
+    """Overload selected only for lists whose items are all ints."""
+    _ = x
+    return "ints"
+
+
+@runtime_checkable
+class Named(Protocol):
+    """Structural type satisfied by instances with a `name` attribute."""
+
+    name: str
+
+
+class Thing:
+    """Class whose instances may or may not carry a `name`."""
+
+
+def named(x: object) -> str:
+    """Fallback for values that do not satisfy `Named`."""
+    _ = x
+    return "fallback"
+
+
+@dispatch.named
+def _(x: Named) -> str:
+    """Overload for values exposing a `name` attribute."""
+    _ = x
+    return "named"
+
+
+def plain(x: object) -> str:
+    """Fallback for a target whose overloads are decided by type alone."""
+    _ = x
+    return "fallback"
+
+
+@dispatch.plain(x=int)
+def _(x) -> str:
+    """Type-only overload; selections stay cached per argument type."""
+    _ = x
+    return "int"
+
+
+def test_depends_on_value_classification() -> None:
+    """Content-inspecting hints are told apart from type-only hints."""
+
+    class TD(TypedDict):
+        a: int
+
+    for hint in (TD, Named, List[int], Literal[1], Optional[List[int]],
+                 Tuple[int, str], Annotated[TD, "meta"]):
+        assert TypeMatch._depends_on_value(hint), hint
+    for hint in (int, Any, object, list, List, dict, Tuple[Any, ...],
+                 Callable, Optional[int], Annotated[int, "meta"]):
+        assert not TypeMatch._depends_on_value(hint), hint
+
+
+def test_content_dependent_overloads_are_not_cached() -> None:
+    """Same argument type, different contents: each call is re-matched."""
+    assert items([1, 2]) == "ints"
+    assert items(["a"]) == "fallback"
+    assert items([3]) == "ints"
+    reg: Any = modules[__name__].__fdispatch_registry__["items"]
+    assert not reg._cacheable and not reg._cache
+
+
+def test_protocol_overloads_are_not_cached() -> None:
+    """Instances of one class are re-matched against a Protocol."""
+    with_name: Thing = Thing()
+    with_name.name = "a"  # type: ignore[attr-defined]
+    assert named(with_name) == "named"
+    assert named(Thing()) == "fallback"
+    assert named(with_name) == "named"
+
+
+def test_type_only_overloads_keep_cache() -> None:
+    """Registries without content-dependent hints still cache by type."""
+    assert plain(1) == "int"
+    assert plain("x") == "fallback"
+    reg: Any = modules[__name__].__fdispatch_registry__["plain"]
+    assert reg._cacheable and set(reg._cache) == {(int, ), (str, )}
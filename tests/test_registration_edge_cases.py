@@ -32,3 +32,50 @@ def test_register_after_existing_wrapper_replacement() -> None:
     assert gname("a") == "str"
     assert gname(1) == "int"
     assert gname(object()) == "fallback2"
+
+
+class Local:
+    """Class only visible in this module's namespace."""
+
+
+def sname(x: object) -> str:
+    """Fallback for string decorator types."""
+    _ = x
+    return "fallback"
+
+
+@dispatch.sname(x="Local")
+def _(x: object) -> str:
+    """Overload keyed by a string naming a module-level class."""
+    _ = x
+    return "local"
+
+
+@dispatch.sname(x="Missing | None")
+def _(x: object) -> str:
+    """Overload whose string type cannot be evaluated at decoration."""
+    _ = x
+    return "missing"
+
+
+class Holder:
+    """Method overload keyed by a string naming a class attribute."""
+
+    Inner = Local
+
+    def m(self, x: object) -> str:
+        _ = x
+        return "base"
+
+    @dispatch.m(x="Inner")
+    def _(self, x: object) -> str:
+        _ = x
+        return "inner"
+
+
+def test_string_decorator_types_resolve_in_declaring_namespace() -> None:
+    """String types see the overload's module and class namespaces."""
+    assert sname(Local()) == "local"
+    assert sname(1.5) == "fallback"
+    assert Holder().m(Local()) == "inner"
+    assert Holder().m(1) == "base"
@@ -7,7 +7,7 @@ from typing import (
     runtime_checkable,
 )
 
-from wizedispatcher import TypeMatch
+from wizedispatcher import TypeMatch, dispatch
 
 
 # TypedDict tests
@@ -33,6 +33,41 @@ def test_typed_dict_matching() -> None:
     assert TypeMatch._is_match({}, UserPartial)
 
 
+def test_typed_dict_missing_key_rejected_before_values() -> None:
+    """Missing required keys reject without inspecting present values."""
+
+    class Boom:
+        """Value whose type check would fail loudly if attempted."""
+
+        @property
+        def __class__(self) -> type:
+            raise AssertionError("value inspected")
+
+    assert not TypeMatch._is_match({"id": Boom()}, UserTD)
+    assert not TypeMatch._is_match({"name": "a", "extra": 1}, UserTD)
+    assert TypeMatch._is_match({"id": 1, "name": "a", "extra": 1}, UserTD)
+
+
+def greet_user(x: object) -> str:
+    """Fallback for values that are not a complete UserTD."""
+    _ = x
+    return "fallback"
+
+
+@dispatch.greet_user(x=UserTD)
+def _(x) -> str:
+    """Overload reading the UserTD keys."""
+    return f"user:{x['id']}:{x['name']}"
+
+
+def test_typed_dict_missing_keys_rejected_after_valid_call() -> None:
+    """A dict missing keys falls back even after a valid dict was seen."""
+    assert greet_user({"id": 1, "name": "a"}) == "user:1:a"
+    assert greet_user({"other": 1}) == "fallback"
+    assert greet_user({"id": 2}) == "fallback"
+    assert greet_user({"id": 3, "name": "b"}) == "user:3:b"
+
+
 # Protocol tests
 class P(Protocol):
     """Non-runtime protocol used for matching tests."""
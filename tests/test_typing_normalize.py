@@ -5,16 +5,21 @@ from typing import (
     Callable,
     ClassVar,
     Concatenate,
+    Dict,
+    List,
     Literal,
     Optional,
     ParamSpec,
+    Sized,
     Type,
+    TypeVar,
     Union,
     get_args,
     get_origin,
 )
 
 from wizedispatcher import TypingNormalize
+from wizedispatcher.typingnormalize import normalize
 
 
 def test_special_forms_preserved_with_args() -> None:
@@ -86,3 +91,107 @@ def test_preserve_runtime_class_objects() -> None:
 
     tn: Type = TypingNormalize(Type[Custom])  # type: ignore[reportInvalidTypeForm]
     assert get_origin(tn) is type and get_args(tn) == (Custom,)
+
+
+def test_memoization_keeps_union_order_and_literal_types() -> None:
+    """Cached results respect member order and literal value types."""
+    TypingNormalize.cache_clear()
+    assert get_args(TypingNormalize(Union[int, str])) == (int, str)
+    assert get_args(TypingNormalize(Union[str, int])) == (str, int)
+    assert get_args(TypingNormalize(Literal[1])) == (1, )
+    lit_true: Type = TypingNormalize(Literal[True])  # type: ignore[reportInvalidTypeForm]
+    assert get_args(lit_true)[0] is True
+    # Repeated normalization returns the memoized object
+    assert TypingNormalize(list[int]) is TypingNormalize(list[int])
+
+
+def test_default_tables_match_bare_names() -> None:
+    """Bare runtime and typing generics map to the same defaults."""
+    tn: Any = TypingNormalize
+    assert tn._plain_runtime_to_typing(dict) == Dict[Any, Any]
+    assert tn._plain_typing_to_defaults(Dict) == Dict[Any, Any]
+    assert tn._plain_runtime_to_typing(callable) == Callable[..., Any]
+    assert tn._typing_defaults_by_name("Union") is Any
+    assert tn._typing_defaults_by_name("Sized") is Sized
+    assert tn._plain_typing_to_defaults(int) is None
+
+
+def test_tsub_interns_repeat_subscriptions() -> None:
+    """Repeat `_tsub` calls return the same pre-built alias."""
+    tn: Any = TypingNormalize
+    assert tn._tsub("List", (int, )) is tn._tsub("List", (int, ))
+    cb: object = tn._tsub("Callable", ([int], str))
+    assert cb is tn._tsub("Callable", ([int], str))
+    assert cb == Callable[[int], str]
+    assert tn._tsub("Callable", (..., str)) == Callable[..., str]
+    assert get_args(tn._tsub("Union", (str, int))) == (str, int)
+
+
+def test_scalar_and_plain_class_passthrough() -> None:
+    """Already-normal annotations come back unchanged."""
+
+    class Plain:
+        pass
+
+    for tp in (int, str, bool, type(None), Any, Plain):
+        assert TypingNormalize(tp) is tp
+    assert TypingNormalize(type) == Type[Any]
+    assert TypingNormalize(list) == List[Any]
+
+
+def test_bare_and_parameterized_generics_share_one_origin_pass() -> None:
+    """Bare typing generics default; subscripted ones keep their args."""
+    assert TypingNormalize(List) == List[Any]
+    assert TypingNormalize(Dict) == Dict[Any, Any]
+    assert TypingNormalize(list[int]) == List[int]
+    assert TypingNormalize(Callable[[int], str]) == Callable[[int], str]
+    assert get_args(TypingNormalize(int | None)) == (type(None), int)
+
+
+def test_to_union_flattens_in_order_and_collapses_any() -> None:
+    """Nested unions flatten left-to-right with None first and deduped."""
+    tn: Any = TypingNormalize
+    out: object = tn._to_union(str, Union[int, None], bytes | str, float)
+    assert get_args(out) == (type(None), str, int, bytes, float)
+    assert tn._to_union(int, Union[str, Any]) is Any
+    assert tn._to_union(type(None)) is type(None)
+    assert tn._to_union() is Any
+
+
+def test_deeply_nested_generics_normalize_without_recursion() -> None:
+    """Nesting that would exhaust per-level recursion still normalizes."""
+    tp: Any = int
+    for _ in range(400):
+        tp = list[tp]
+    out: Any = TypingNormalize(tp)
+    for _ in range(3):
+        assert get_origin(out) is list
+        out = get_args(out)[0]
+    assert TypingNormalize(Dict[str, List[Dict[str, int]]]) == Dict[str, List[
+        Dict[str, int]]]
+
+
+def test_callables_nested_in_generics_normalize_iteratively() -> None:
+    """Callable parameter lists inside generics are normalized in place."""
+    inner: Any = Callable[[list[int | str], Optional[bytes]], Optional[str]]
+    assert TypingNormalize(inner) == Callable[
+        [List[Union[int, str]], Optional[bytes]], Optional[str]]
+    assert TypingNormalize(Dict[str, inner]) == Dict[str, Callable[
+        [List[Union[int, str]], Optional[bytes]], Optional[str]]]
+    assert TypingNormalize(Callable[[], list]) == Callable[[], List[Any]]
+
+
+def test_constrained_and_bound_typevars_build_unions() -> None:
+    """Constraints become a flat Union; a bound normalizes to itself."""
+    tn_t: Any = TypingNormalize(TypeVar("T", str, bytes))
+    assert tn_t == Union[str, bytes]
+    assert TypingNormalize(TypeVar("N", int, None)) == Optional[int]
+    assert TypingNormalize(TypeVar("B", bound=list)) == List[Any]
+    assert TypingNormalize(list[TypeVar("E", int, str)]) == List[Union[int,
+                                                                     str]]
+
+
+def test_normalize_function_matches_class_entry_point() -> None:
+    """The module-level function returns exactly what the class does."""
+    for tp in (int, list, List, Union[int, str, None], Callable[[list], int]):
+        assert normalize(tp) is TypingNormalize(tp)
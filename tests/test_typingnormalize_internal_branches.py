@@ -17,6 +17,8 @@ from typing import (
     get_origin,
 )
 
+from pytest import importorskip
+
 from wizedispatcher.typingnormalize import TypingNormalize
 
 
@@ -36,6 +38,14 @@ def test_helpers_typevar_paramspec_union_callable_origin() -> None:
     assert TypingNormalize._is_callable_origin(None) is False
 
 
+def test_typevar_paramspec_checks_accept_typing_extensions() -> None:
+    """Backported TypeVar/ParamSpec classes are recognized too."""
+    te: ModuleType = importorskip("typing_extensions")
+    assert TypingNormalize._is_typevar(te.TypeVar("T")) is True
+    assert TypingNormalize._is_paramspec(te.ParamSpec("P")) is True
+    assert TypingNormalize._is_typevar(t.TypeVar) is False
+
+
 def test_string_to_type_and_forwardref_resolution_paths() -> None:
     """String type resolution and ForwardRef fallback branches."""
     # Use builtins fallback path (not in predefined map)
@@ -161,3 +171,53 @@ def test_exec_main_block_for_demo_coverage() -> None:
             exec(compile(src, path, "exec"), g, g)
         # The demo prints multiple lines; ensure something was captured
         assert buf.getvalue()
+
+
+def test_string_to_type_none_aliases_and_forwardref() -> None:
+    """None aliases map to NoneType and ForwardRefs use the same table."""
+    assert TypingNormalize._string_to_type("None") is type(None)
+    assert TypingNormalize._string_to_type("NoneType") is type(None)
+    assert TypingNormalize._string_to_type("int") is int
+    assert TypingNormalize._resolve_forward_ref(ForwardRef("bytes")) is bytes
+
+
+def test_from_origin_special_form_handlers() -> None:
+    """ClassVar/Annotated/Literal origins use their own subscription."""
+    assert TypingNormalize._from_origin(t.ClassVar, ()) is t.ClassVar
+    assert TypingNormalize._from_origin(t.ClassVar, (int, )) == t.ClassVar[int]
+    assert get_args(TypingNormalize._from_origin(t.Literal,
+                                                 (1, "a"))) == (1, "a")
+    ann: object = TypingNormalize._from_origin(t.Annotated, (int, "m"))
+    assert get_args(ann) == (int, "m")
+
+
+def test_from_origin_builders_map_runtime_origins() -> None:
+    """Runtime origins subscript their typing alias in one step."""
+    assert TypingNormalize._from_origin(list, (int, )) == t.List[int]
+    assert TypingNormalize._from_origin(tuple,
+                                        (int, Ellipsis)) == t.Tuple[int, ...]
+    try:
+        TypingNormalize._from_origin(list, (int, str))
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("expected ValueError")
+
+
+def test_norm_args_reuses_unchanged_tuple() -> None:
+    """Already-normal arguments come back as the same tuple object."""
+    args: tuple[object, ...] = (int, str)
+    assert TypingNormalize._norm_args(args) is args
+    assert TypingNormalize._norm_args((list, int)) == (t.List[Any], int)
+
+
+def test_typing_tables_are_read_only_and_defaults_by_identity() -> None:
+    """Lookup tables are frozen; defaults lookup never hashes its input."""
+    try:
+        TypingNormalize._TYPING_MAP[int] = "int"  # type: ignore[index]
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("expected TypeError")
+    assert TypingNormalize._plain_typing_to_defaults(t.List) == t.List[Any]
+    assert TypingNormalize._plain_typing_to_defaults([int]) is None